@@ -95,6 +95,8 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down application")
+    await app.state.canon_guardian_service.close()
+    await app.state.canon_mechanic_service.close()
 
 
 def create_app() -> FastAPI:
@@ -145,7 +147,7 @@ def create_app() -> FastAPI:
         return {
             "status": "healthy",
             "service": "worldbuilding-companion",
-            "backboard_available": app.state.backboard.is_available if hasattr(app.state, 'backboard') else False,
+            "backboard_available": app.state.backboard.available if hasattr(app.state, 'backboard') else False,
         }
 
     @app.get("/")
@@ -8,6 +8,7 @@ from pydantic_settings import BaseSettings
 from functools import lru_cache
 
 import os
+import tempfile
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 
@@ -22,6 +23,7 @@ class Settings(BaseSettings):
     BACKBOARD_RETRY_MAX_SECONDS: float = 4.0
     BACKBOARD_INDEXING_WAIT_SECONDS: int = 120
     BACKBOARD_INDEXING_RETRY_SECONDS: float = 2.0
+    BACKBOARD_UPLOAD_CONCURRENCY: int = 4
 
     NOTE_ANALYSIS_CHUNK_MAX_CHARS: int = 1000
     NOTE_ANALYSIS_CHUNK_OVERLAP_CHARS: int = 150
@@ -37,6 +39,7 @@ class Settings(BaseSettings):
 
     DATABASE_PATH: str = "database/world.db"
     DOCUMENTS_PATH: str = "documents"
+    BACKBOARD_SCRATCH_DIR: str = ""
 
     LLM_PROVIDER: str = "openai"
     MODEL_NAME: str = "gpt-4.1-mini"
@@ -61,6 +64,11 @@ class Settings(BaseSettings):
         if not docs_path.is_absolute():
             self.DOCUMENTS_PATH = str((BASE_DIR / docs_path).resolve())
 
+        if not self.BACKBOARD_SCRATCH_DIR:
+            shm_dir = Path("/dev/shm")
+            scratch_root = shm_dir if shm_dir.is_dir() else Path(tempfile.gettempdir())
+            self.BACKBOARD_SCRATCH_DIR = str(scratch_root / "fable-docs")
+
         return self
 
 
@@ -2,8 +2,12 @@
 Database connection and initialization.
 """
 
-import aiosqlite
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
+
+import aiosqlite
 from app.config import settings
 from app.logging import get_logger
 
@@ -12,6 +16,96 @@ logger = get_logger('database')
 DATABASE_PATH = Path(settings.DATABASE_PATH)
 
 
+class SharedConnection:
+    """
+    A lazily opened, tuned write connection plus a read-only companion.
+
+    Services keep one instance for their lifetime. Writes go through
+    :meth:`write_transaction`, which serialises them behind a lock as one
+    ``BEGIN IMMEDIATE`` ... ``COMMIT`` and rolls back on any error. Reads go
+    through :meth:`reader`; under WAL that connection only sees committed
+    data, never another coroutine's open transaction.
+    """
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = db_path
+        self._writer: aiosqlite.Connection | None = None
+        self._reader: aiosqlite.Connection | None = None
+        self._open_lock = asyncio.Lock()
+        # Writers share one connection, so transactions must not interleave.
+        self._write_lock = asyncio.Lock()
+
+    async def _open(self, *, read_only: bool = False) -> aiosqlite.Connection:
+        # Autocommit mode: the driver never opens a transaction behind our
+        # back, so only write_transaction can hold one open.
+        db = await aiosqlite.connect(self.db_path, isolation_level=None)
+        db.row_factory = aiosqlite.Row
+        await db.execute("PRAGMA journal_mode = WAL")
+        await db.execute("PRAGMA synchronous = NORMAL")
+        await db.execute("PRAGMA temp_store = MEMORY")
+        await db.execute("PRAGMA cache_size = -64000")
+        await db.execute("PRAGMA mmap_size = 268435456")
+        await db.execute("PRAGMA busy_timeout = 5000")
+        await db.execute("PRAGMA foreign_keys = ON")
+        if read_only:
+            await db.execute("PRAGMA query_only = ON")
+        return db
+
+    async def _ensure_writer(self) -> aiosqlite.Connection:
+        if self._writer is not None:
+            return self._writer
+        async with self._open_lock:
+            if self._writer is None:
+                self._writer = await self._open()
+        return self._writer
+
+    async def reader(self) -> aiosqlite.Connection:
+        """
+        Return the shared read-only connection, opening it on first use.
+
+        :return: Connection that sees only committed data
+        :rtype: aiosqlite.Connection
+        """
+        if self._reader is not None:
+            return self._reader
+        async with self._open_lock:
+            if self._reader is None:
+                self._reader = await self._open(read_only=True)
+        return self._reader
+
+    @asynccontextmanager
+    async def write_transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Run the enclosed writes as one BEGIN IMMEDIATE transaction under the write lock.
+
+        :return: The write connection, inside an open transaction
+        :rtype: AsyncIterator[aiosqlite.Connection]
+        """
+        db = await self._ensure_writer()
+        async with self._write_lock:
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+            await db.commit()
+
+    async def close(self) -> None:
+        """
+        Close both connections.
+
+        :return: None
+        :rtype: None
+        """
+        async with self._open_lock:
+            if self._writer is not None:
+                await self._writer.close()
+                self._writer = None
+            if self._reader is not None:
+                await self._reader.close()
+                self._reader = None
+
 async def _table_columns(db: aiosqlite.Connection, table_name: str) -> set[str]:
     cursor = await db.execute(f"PRAGMA table_info({table_name})")
     rows = await cursor.fetchall()
@@ -217,6 +311,10 @@ async def init_db():
         await db.commit()
         await _migrate_guardian_runs_drop_note_id(db)
         await _migrate_guardian_action_type_constraints(db)
+        # Gather planner statistics once so the composite indexes get picked.
+        cursor = await db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        if await cursor.fetchone() is None:
+            await db.execute("ANALYZE")
         await db.commit()
         logger.info(f"Database initialized at {DATABASE_PATH}")
 
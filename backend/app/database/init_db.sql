@@ -235,6 +235,8 @@ CREATE INDEX IF NOT EXISTS idx_timeline_operations_marker_sort
     ON timeline_operations(marker_id, order_index, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_timeline_operations_world
     ON timeline_operations(world_id);
+CREATE INDEX IF NOT EXISTS idx_timeline_operations_world_marker_order
+    ON timeline_operations(world_id, marker_id, order_index, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_timeline_snapshots_world
     ON timeline_snapshots(world_id);
 CREATE INDEX IF NOT EXISTS idx_guardian_runs_world_created
@@ -249,6 +251,8 @@ CREATE INDEX IF NOT EXISTS idx_guardian_mechanic_runs_run
     ON guardian_mechanic_runs(run_id);
 CREATE INDEX IF NOT EXISTS idx_guardian_mechanic_options_run_status
     ON guardian_mechanic_options(mechanic_run_id, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_guardian_mechanic_options_run_order
+    ON guardian_mechanic_options(mechanic_run_id, option_index, created_at, id);
 CREATE INDEX IF NOT EXISTS idx_guardian_mechanic_options_finding
     ON guardian_mechanic_options(finding_id);
 CREATE INDEX IF NOT EXISTS idx_world_rag_documents_world_slot
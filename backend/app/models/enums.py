@@ -4,6 +4,7 @@ Enum definitions for the Fable API.
 EntityType and RelationType are dynamic (str) to allow world-specific types.
 """
 from enum import Enum
+from functools import lru_cache
 
 
 class EntitySource(str, Enum):
@@ -26,6 +27,7 @@ class EntityResolutionStatus(str, Enum):
     PENDING = "pending"
 
 
+@lru_cache(maxsize=2048)
 def normalize_type(type_str: str) -> str:
     """
     Normalize a type string for consistency.
@@ -34,6 +36,8 @@ def normalize_type(type_str: str) -> str:
     - Strip whitespace
     - Replace spaces with underscores
 
+    Results are memoized: the set of distinct type/kind strings is small.
+
     Examples:
         "Character" -> "character"
         "Parent Of" -> "parent_of"
@@ -6,8 +6,13 @@ Analysis/extraction logic lives in LoreService — this is the transport layer.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import inspect
 import os
-import re
+import shutil
+import string
+import tempfile
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
@@ -18,36 +23,100 @@ from app.logging import get_logger
 from app.models import (
     AssistantCreated, ThreadCreated, ThreadDeleted,
     DocumentCreated, DocumentUpdated, ChatResponse,
+    BackboardResult,
 )
 from app.services.prompts import build_world_assistant_prompt
 
 logger = get_logger('services.backboard')
 _T = TypeVar("_T")
 
+# Byte table mapping every character outside [A-Za-z0-9_-] to "_" for document file names.
+_SAFE_NAME_CHARS = frozenset((string.ascii_letters + string.digits + "_-").encode("ascii"))
+_SAFE_NAME_TABLE = bytes(c if c in _SAFE_NAME_CHARS else ord("_") for c in range(256))
+
+# Shared pool for blocking scratch-file I/O; sized like the upload semaphore so
+# concurrent ingests cannot pile up unbounded file handles and buffers.
+_IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=max(int(settings.BACKBOARD_UPLOAD_CONCURRENCY), 1),
+    thread_name_prefix="backboard-io",
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _document_filename(assistant_id: str, document_type: str) -> str:
+    safe_type = document_type.encode('ascii', 'replace').translate(_SAFE_NAME_TABLE).decode('ascii')
+    return f"{assistant_id}_{safe_type}.md"
+
+
+def _make_scratch_dir() -> str:
+    os.makedirs(settings.BACKBOARD_SCRATCH_DIR, exist_ok=True)
+    return tempfile.mkdtemp(dir=settings.BACKBOARD_SCRATCH_DIR)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _failed(result_cls: type[BackboardResult], error: str) -> BackboardResult:
+    if "error" in result_cls.model_fields:
+        return result_cls(success=False, error=error)
+    return result_cls(success=False)
+
+
+def _remote(result_cls: type[BackboardResult], *context_args: str):
+    """Return a failed result when Backboard is unavailable or the call raises.
+
+    ``context_args`` names the arguments (ids, document type) logged with a
+    failure so it can be traced back to the object involved.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self: "BackboardService", *args, **kwargs):
+            if not self.available:
+                return _failed(result_cls, "Backboard service unavailable")
+            try:
+                return await fn(self, *args, **kwargs)
+            except Exception as e:
+                bound = signature.bind_partial(self, *args, **kwargs).arguments
+                context = " ".join(f"{name}={bound.get(name)}" for name in context_args)
+                logger.error("Backboard %s failed (%s): %s", fn.__name__, context, e)
+                return _failed(result_cls, str(e))
+        return wrapper
+    return decorator
+
+
 class BackboardService:
     """Service for interacting with Backboard.io."""
 
     def __init__(self):
         self.client = None
-        self._initialized = False
+        self.available = False
+        self._ready = asyncio.Event()
+        self._init_lock = asyncio.Lock()
+        self._upload_semaphore = asyncio.Semaphore(max(int(settings.BACKBOARD_UPLOAD_CONCURRENCY), 1))
 
     async def initialize(self):
-        if not settings.BACKBOARD_API_KEY:
-            logger.warning("BACKBOARD_API_KEY not set - AI features will be disabled")
-            return
-
-        try:
-            self.client = BackboardClient(api_key=settings.BACKBOARD_API_KEY)
-            self._initialized = True
-            logger.info("Backboard client initialized")
-        except ImportError:
-            logger.warning("backboard package not installed - run: pip install backboard")
-        except Exception as e:
-            logger.error(f"Failed to initialize Backboard: {e}")
-
-    @property
-    def is_available(self) -> bool:
-        return self._initialized and self.client is not None
+        async with self._init_lock:
+            if self._ready.is_set():
+                return
+            try:
+                if not settings.BACKBOARD_API_KEY:
+                    logger.warning("BACKBOARD_API_KEY not set - AI features will be disabled")
+                    return
+
+                try:
+                    self.client = BackboardClient(api_key=settings.BACKBOARD_API_KEY)
+                    self.available = True
+                    logger.info("Backboard client initialized")
+                except ImportError:
+                    logger.warning("backboard package not installed - run: pip install backboard")
+                except Exception as e:
+                    logger.error("Failed to initialize Backboard: %s", e)
+            finally:
+                self._ready.set()
 
     def _is_transient_error(self, error: Exception) -> bool:
         if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
@@ -118,49 +187,31 @@ class BackboardService:
 
     # ── Assistants ──
 
+    @_remote(AssistantCreated, "world_name")
     async def create_world_assistant(self, world_name: str, description: str = "") -> AssistantCreated:
-        if not self.is_available:
-            return AssistantCreated(success=False)
-
-        try:
-            assistant = await self.client.create_assistant(
-                name=f"World: {world_name}",
-                embedding_provider=settings.EMBEDDING_PROVIDER,
-                embedding_model_name=settings.EMBEDDING_MODEL,
-                description=build_world_assistant_prompt(world_name, description)
-            )
-            logger.info(f"Created world assistant: {assistant.assistant_id}")
-            return AssistantCreated(success=True, id=str(assistant.assistant_id))
-        except Exception as e:
-            logger.error(f"Failed to create world assistant: {e}")
-            return AssistantCreated(success=False)
+        assistant = await self.client.create_assistant(
+            name=f"World: {world_name}",
+            embedding_provider=settings.EMBEDDING_PROVIDER,
+            embedding_model_name=settings.EMBEDDING_MODEL,
+            description=build_world_assistant_prompt(world_name, description)
+        )
+        logger.info("Created world assistant: %s", assistant.assistant_id)
+        return AssistantCreated(success=True, id=str(assistant.assistant_id))
 
     # ── Threads ──
 
+    @_remote(ThreadCreated, "assistant_id")
     async def create_thread(self, assistant_id: str) -> ThreadCreated:
-        if not self.is_available:
-            return ThreadCreated(success=False)
-
-        try:
-            thread = await self._run_with_retry(
-                "create_thread",
-                lambda: self.client.create_thread(assistant_id=assistant_id),
-            )
-            return ThreadCreated(success=True, id=str(thread.thread_id))
-        except Exception as e:
-            logger.error(f"Failed to create thread for assistant {assistant_id}: {e}")
-            return ThreadCreated(success=False)
+        thread = await self._run_with_retry(
+            "create_thread",
+            lambda: self.client.create_thread(assistant_id=assistant_id),
+        )
+        return ThreadCreated(success=True, id=str(thread.thread_id))
 
+    @_remote(ThreadDeleted, "thread_id")
     async def delete_thread(self, thread_id: str) -> ThreadDeleted:
-        if not self.is_available:
-            return ThreadDeleted(success=False)
-
-        try:
-            await self.client.delete_thread(thread_id=thread_id)
-            return ThreadDeleted(success=True)
-        except Exception as e:
-            logger.error(f"Failed to delete thread: {e}")
-            return ThreadDeleted(success=False)
+        await self.client.delete_thread(thread_id=thread_id)
+        return ThreadDeleted(success=True)
 
     # ── Chat ──
 
@@ -174,10 +225,8 @@ class BackboardService:
             return "Readonly"
         return "off"
 
+    @_remote(ChatResponse, "thread_id")
     async def chat(self, thread_id: str, prompt: str, memory: bool | str = False) -> ChatResponse:
-        if not self.is_available:
-            return ChatResponse(success=False, error="Backboard service unavailable")
-
         max_wait_seconds = max(int(settings.BACKBOARD_INDEXING_WAIT_SECONDS), 0)
         retry_delay_seconds = max(float(settings.BACKBOARD_INDEXING_RETRY_SECONDS), 0.1)
         llm_provider = str(getattr(settings, "LLM_PROVIDER", "") or "").strip()
@@ -296,59 +345,57 @@ class BackboardService:
                     await asyncio.sleep(sleep_for)
                     continue
 
-                logger.error(f"Chat failed for thread {thread_id}: {e}")
+                logger.error("Chat failed for thread %s: %s", thread_id, e)
                 return ChatResponse(success=False, error=str(e))
 
     # ── Documents (RAG) ──
 
-    def _get_document_path(self, assistant_id: str, document_type: str) -> str:
-        docs_dir = settings.DOCUMENTS_PATH
-        os.makedirs(docs_dir, exist_ok=True)
-        safe_type = re.sub(r'[^\w\-]', '_', document_type)
-        filename = f"{assistant_id}_{safe_type}.md"
-        return os.path.join(docs_dir, filename)
+    def _get_document_path(self, docs_dir: str, assistant_id: str, document_type: str) -> str:
+        return os.path.join(docs_dir, _document_filename(assistant_id, document_type))
 
+    async def _upload_document(self, assistant_id: str, document_type: str, content: str) -> Any:
+        """Stage content in a scratch dir just long enough for the SDK to upload it."""
+        loop = asyncio.get_running_loop()
+        async with self._upload_semaphore:
+            scratch_dir = await loop.run_in_executor(_IO_EXECUTOR, _make_scratch_dir)
+            try:
+                doc_path = self._get_document_path(scratch_dir, assistant_id, document_type)
+                await loop.run_in_executor(_IO_EXECUTOR, _write_bytes, doc_path, content.encode('utf-8'))
+
+                return await self.client.upload_document_to_assistant(
+                    assistant_id=assistant_id,
+                    file_path=doc_path
+                )
+            finally:
+                await loop.run_in_executor(_IO_EXECUTOR, shutil.rmtree, scratch_dir, True)
+
+    @_remote(DocumentCreated, "assistant_id", "document_type")
     async def create_lore_document(
         self, assistant_id: str, document_type: str, content: str,
     ) -> DocumentCreated:
-        if not self.is_available:
-            return DocumentCreated(success=False)
-
-        try:
-            doc_path = self._get_document_path(assistant_id, document_type)
-            with open(doc_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            document = await self.client.upload_document_to_assistant(
-                assistant_id=assistant_id,
-                file_path=doc_path
-            )
-            logger.info(f"Created document: {document_type} -> {document.document_id}")
-            return DocumentCreated(success=True, id=str(document.document_id))
-        except Exception as e:
-            logger.error(f"Failed to create document ({document_type}): {e}")
-            return DocumentCreated(success=False)
+        document = await self._upload_document(assistant_id, document_type, content)
+        logger.info("Created document: %s -> %s", document_type, document.document_id)
+        return DocumentCreated(success=True, id=str(document.document_id))
+
+    async def bulk_upload_documents(
+        self, assistant_id: str, docs: list[tuple[str, str]],
+    ) -> list[DocumentCreated]:
+        """Upload (document_type, content) pairs concurrently; results follow input order."""
+        if not self.available:
+            return [DocumentCreated(success=False) for _ in docs]
+
+        results = await asyncio.gather(
+            *(self.create_lore_document(assistant_id, document_type, content) for document_type, content in docs)
+        )
+        return list(results)
 
+    @_remote(DocumentUpdated, "assistant_id", "document_type", "document_id")
     async def update_lore_document(
         self, assistant_id: str, document_id: str, document_type: str, content: str,
     ) -> DocumentUpdated:
-        if not self.is_available:
-            return DocumentUpdated(success=False)
-
-        try:
-            doc_path = self._get_document_path(assistant_id, document_type)
-            with open(doc_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            await self.client.delete_document(document_id=document_id)
-            logger.debug(f"Deleted existing document: {document_type} ({document_id})")
-
-            document = await self.client.upload_document_to_assistant(
-                assistant_id=assistant_id,
-                file_path=doc_path
-            )
-            logger.info(f"Updated document: {document_type} -> {document.document_id}")
-            return DocumentUpdated(success=True, id=str(document.document_id))
-        except Exception as e:
-            logger.error(f"Failed to update document ({document_type}): {e}")
-            return DocumentUpdated(success=False)
+        await self.client.delete_document(document_id=document_id)
+        logger.debug("Deleted existing document: %s (%s)", document_type, document_id)
+
+        document = await self._upload_document(assistant_id, document_type, content)
+        logger.info("Updated document: %s -> %s", document_type, document.document_id)
+        return DocumentUpdated(success=True, id=str(document.document_id))
@@ -1,14 +1,24 @@
 """Canon Guardian service with deterministic hard-rule contradiction checks."""
 
+import asyncio
+import heapq
+import io
 import json
+import math
 import re
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
 import aiosqlite
+import orjson
+from pydantic import TypeAdapter
 
+from app.database.db import SharedConnection
 from app.logging import get_logger
 from app.models import (
     GuardianAction,
@@ -17,7 +27,6 @@ from app.models import (
     GuardianEvidenceRef,
     GuardianFinding,
     GuardianFindingStatusUpdate,
-    GuardianRun,
     GuardianRunDetail,
     GuardianScanAccepted,
     GuardianScanRequest,
@@ -28,11 +37,15 @@ from app.services.prompts import build_canon_guardian_soft_critic_prompt
 
 logger = get_logger("services.canon_guardian")
 
-INACTIVE_ENTITY_STATUSES = {"inactive", "deceased", "dead", "destroyed", "retired", "gone"}
+INACTIVE_ENTITY_STATUSES = frozenset({"inactive", "deceased", "dead", "destroyed", "retired", "gone"})
 SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
 ENTITY_OPS = {"entity_create", "entity_patch", "entity_delete", "entity_add", "entity_update", "entity_modify", "entity_remove"}
 RELATION_OPS = {"relation_create", "relation_patch", "relation_delete", "relation_add", "relation_update", "relation_modify", "relation_remove"}
 WORLD_OPS = {"world_patch"}
+# Relation ops that create or reshape an edge; without a target_id their
+# payload must spell out the full edge.
+RELATION_TARGET_REQUIRED_OPS = frozenset({"relation_create", "relation_patch", "relation_add", "relation_update", "relation_modify"})
+RELATION_PAYLOAD_REQUIRED_FIELDS = ("source_entity_id", "target_entity_id", "type")
 ALLOWED_SEVERITIES = {"critical", "high", "medium", "low", "info"}
 ALLOWED_ACTION_TYPES = {
     "timeline_operation",
@@ -44,55 +57,164 @@ ALLOWED_ACTION_TYPES = {
     "noop",
 }
 ALLOWED_EVIDENCE_KINDS = {"note", "entity", "relation", "timeline_marker", "timeline_operation", "world"}
+_EVIDENCE_LIST_ADAPTER = TypeAdapter(list[GuardianEvidenceRef])
 
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _parse_json(raw: str) -> Any:
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # stdlib json also accepts NaN/Infinity and arbitrarily large ints
+        return json.loads(raw)
+
+
 def _load_json(raw: str | None, fallback):
     if not raw:
         return fallback
     try:
-        return json.loads(raw)
+        return _parse_json(raw)
     except json.JSONDecodeError:
         return fallback
 
 
-def _normalize_identity(text: str | None) -> str:
-    return " ".join((text or "").strip().lower().split())
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
 
 
-def _phrase_in_text(text: str, phrase: str) -> bool:
-    normalized_phrase = _normalize_identity(phrase)
-    if not normalized_phrase or len(normalized_phrase) < 2:
-        return False
-    escaped = re.escape(normalized_phrase)
-    if re.search(rf"(?<!\w){escaped}(?!\w)", text):
-        return True
-    return normalized_phrase in text
+def _dump_json(value: Any) -> str:
+    try:
+        dumped = orjson.dumps(value)
+    except TypeError:
+        # orjson rejects e.g. integers wider than 64 bits
+        return json.dumps(value)
+    # orjson writes NaN/Infinity as null; keep stdlib's NaN so values
+    # _parse_json accepted round-trip unchanged.
+    if b"null" in dumped and _has_non_finite(value):
+        return json.dumps(value)
+    return dumped.decode()
+
+
+def _take_section(header: str, lines, limit: int) -> tuple[str, bool]:
+    """Format one context-pack section, stopping as soon as it overflows ``limit``.
+
+    Returns the (possibly partial) section text and whether it fits whole.
+    """
+    parts = [header]
+    size = len(header)
+    for line in lines:
+        parts.append(line)
+        size += 1 + len(line)
+        # Trailing whitespace of the last line would be stripped, so it must
+        # not count towards deciding the section overflows.
+        if size - (len(line) - len(line.rstrip())) > limit:
+            return "\n".join(parts), False
+    if len(parts) == 1:
+        parts.append("- none")
+    text = "\n".join(parts).rstrip()
+    return text, len(text) <= limit
 
 
-def _row_to_run(row: dict) -> GuardianRun:
-    return GuardianRun(
-        id=row["id"],
-        world_id=row["world_id"],
-        trigger_kind=row["trigger_kind"],
-        status=row["status"],
-        request=_load_json(row.get("request_json"), {}),
-        summary=_load_json(row.get("summary_json"), None),
-        error=row.get("error"),
-        started_at=row.get("started_at"),
-        completed_at=row.get("completed_at"),
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-    )
+def _normalize_identity(text: str | None) -> str:
+    return " ".join((text or "").strip().lower().split())
 
 
-def _row_to_finding(row: dict) -> GuardianFinding:
-    evidence_rows = _load_json(row.get("evidence_json"), [])
-    evidence = [GuardianEvidenceRef(**entry) for entry in evidence_rows]
-    return GuardianFinding(
+@lru_cache(maxsize=32)
+def _compile_phrase_matcher(phrases: tuple[str, ...]) -> re.Pattern[str]:
+    # Zero-width lookahead so every start position is reported; longest
+    # alternatives first so each position yields its longest phrase.
+    alternation = "|".join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+@lru_cache(maxsize=1024)
+def _finding_code_family(code: str) -> str:
+    return normalize_type(code or "").removeprefix("soft_")
+
+
+def _evidence_signature(evidence: list[dict]) -> tuple[str, ...]:
+    return tuple(sorted(f"{item['kind']}:{item['id']}" for item in evidence))
+
+
+@dataclass(slots=True)
+class _FindingDraft:
+    """Scan-time finding; persisted column by column, never returned to API callers."""
+
+    id: str
+    run_id: str
+    world_id: str
+    severity: str
+    finding_code: str
+    title: str
+    detail: str
+    confidence: float
+    evidence: list[dict[str, str]]
+    created_at: str
+    updated_at: str
+    resolution_status: str = "open"
+    suggested_action_count: int = 0
+
+
+@dataclass(slots=True)
+class _ActionDraft:
+    """Scan-time remediation action; persisted column by column."""
+
+    id: str
+    run_id: str
+    finding_id: str | None
+    world_id: str
+    action_type: str
+    rationale: str
+    created_at: str
+    updated_at: str
+    op_type: str | None = None
+    target_kind: str | None = None
+    target_id: str | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+    status: str = "proposed"
+    error: str | None = None
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+# Rows below were written by this service, so models are built with
+# model_construct (no field validation); timestamps are parsed up front so
+# the constructed models carry the same types validation would produce.
+# The evidence blob is the one column SQLite cannot shape-check, so it
+# still goes through the adapter.
+
+
+def _run_fields(row: aiosqlite.Row) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "world_id": row["world_id"],
+        "trigger_kind": row["trigger_kind"],
+        "status": row["status"],
+        "request": _load_json(row["request_json"], {}),
+        "summary": _load_json(row["summary_json"], None),
+        "error": row["error"],
+        "started_at": _parse_timestamp(row["started_at"]),
+        "completed_at": _parse_timestamp(row["completed_at"]),
+        "created_at": _parse_timestamp(row["created_at"]),
+        "updated_at": _parse_timestamp(row["updated_at"]),
+    }
+
+
+def _row_to_finding(row: aiosqlite.Row) -> GuardianFinding:
+    evidence_rows = _load_json(row["evidence_json"], [])
+    evidence = _EVIDENCE_LIST_ADAPTER.validate_python(evidence_rows)
+    return GuardianFinding.model_construct(
         id=row["id"],
         run_id=row["run_id"],
         world_id=row["world_id"],
@@ -104,27 +226,27 @@ def _row_to_finding(row: dict) -> GuardianFinding:
         resolution_status=row["resolution_status"],
         evidence=evidence,
         suggested_action_count=row["suggested_action_count"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+        created_at=_parse_timestamp(row["created_at"]),
+        updated_at=_parse_timestamp(row["updated_at"]),
     )
 
 
-def _row_to_action(row: dict) -> GuardianAction:
-    return GuardianAction(
+def _row_to_action(row: aiosqlite.Row) -> GuardianAction:
+    return GuardianAction.model_construct(
         id=row["id"],
         run_id=row["run_id"],
-        finding_id=row.get("finding_id"),
+        finding_id=row["finding_id"],
         world_id=row["world_id"],
         action_type=row["action_type"],
-        op_type=row.get("op_type"),
-        target_kind=row.get("target_kind"),
-        target_id=row.get("target_id"),
-        payload=_load_json(row.get("payload"), {}),
-        rationale=row.get("rationale"),
+        op_type=row["op_type"],
+        target_kind=row["target_kind"],
+        target_id=row["target_id"],
+        payload=_load_json(row["payload"], {}),
+        rationale=row["rationale"],
         status=row["status"],
-        error=row.get("error"),
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+        error=row["error"],
+        created_at=_parse_timestamp(row["created_at"]),
+        updated_at=_parse_timestamp(row["updated_at"]),
     )
 
 
@@ -134,12 +256,11 @@ class CanonGuardianService:
     def __init__(self, db_path: str, backboard: BackboardService | None = None):
         self.db_path = db_path
         self.backboard = backboard
+        self._db = SharedConnection(db_path)
 
-    async def _get_db(self) -> aiosqlite.Connection:
-        db = await aiosqlite.connect(self.db_path)
-        db.row_factory = aiosqlite.Row
-        await db.execute("PRAGMA foreign_keys = ON")
-        return db
+    async def close(self) -> None:
+        """Close the shared connections (called on application shutdown)."""
+        await self._db.close()
 
     async def _world_exists(self, db: aiosqlite.Connection, world_id: str) -> bool:
         cursor = await db.execute("SELECT 1 FROM worlds WHERE id = ?", (world_id,))
@@ -154,16 +275,10 @@ class CanonGuardianService:
         assistant_id = row["assistant_id"]
         return str(assistant_id) if assistant_id else None
 
-    async def _list_notes(self, db: aiosqlite.Connection, world_id: str) -> list[dict]:
-        cursor = await db.execute(
-            """SELECT id, world_id, title, content, analysis_thread_id, created_at, updated_at
-               FROM notes
-               WHERE world_id = ?
-               ORDER BY updated_at DESC, created_at DESC, id DESC""",
-            (world_id,),
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+    async def _list_note_ids(self, db: aiosqlite.Connection, world_id: str) -> frozenset[str]:
+        # Scans only need note ids (for evidence validation), not note bodies.
+        cursor = await db.execute("SELECT id FROM notes WHERE world_id = ?", (world_id,))
+        return frozenset(row[0] for row in await cursor.fetchall() if row[0])
 
     async def _list_entities(self, db: aiosqlite.Connection, world_id: str) -> list[dict]:
         cursor = await db.execute(
@@ -179,6 +294,11 @@ class CanonGuardianService:
             entity = dict(row)
             entity["aliases"] = _load_json(entity.get("aliases"), [])
             entity["status"] = str(entity.get("status") or "active")
+            # Normalized keys are computed once here so the hard rules can index them.
+            entity["_norm_name"] = _normalize_identity(entity.get("name"))
+            entity["_norm_status"] = _normalize_identity(entity["status"])
+            entity["_norm_aliases"] = [key for key in map(_normalize_identity, entity["aliases"]) if key]
+            entity["_norm_type"] = normalize_type(entity.get("type") or "")
             entities.append(entity)
         return entities
 
@@ -191,9 +311,14 @@ class CanonGuardianService:
             (world_id,),
         )
         rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        relations: list[dict] = []
+        for row in rows:
+            relation = dict(row)
+            relation["_norm_type"] = normalize_type(relation.get("type") or "")
+            relations.append(relation)
+        return relations
 
-    async def _list_markers(self, db: aiosqlite.Connection, world_id: str) -> list[dict]:
+    async def _list_markers(self, db: aiosqlite.Connection, world_id: str) -> list[aiosqlite.Row]:
         cursor = await db.execute(
             """SELECT id, world_id, title, marker_kind, date_label, date_sort_value, sort_key, source_note_id, created_at, updated_at
                FROM timeline_markers
@@ -201,8 +326,7 @@ class CanonGuardianService:
                ORDER BY sort_key ASC, created_at ASC, id ASC""",
             (world_id,),
         )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return await cursor.fetchall()
 
     async def _list_operations(self, db: aiosqlite.Connection, world_id: str) -> list[dict]:
         cursor = await db.execute(
@@ -221,7 +345,7 @@ class CanonGuardianService:
                    m.marker_kind AS marker_kind,
                    m.date_sort_value AS marker_date_sort_value
                FROM timeline_operations o
-               JOIN timeline_markers m ON m.id = o.marker_id
+               JOIN timeline_markers m ON m.id = o.marker_id AND m.world_id = o.world_id
                WHERE o.world_id = ?
                ORDER BY m.sort_key ASC, m.created_at ASC, m.id ASC, o.order_index ASC, o.created_at ASC, o.id ASC""",
             (world_id,),
@@ -236,24 +360,48 @@ class CanonGuardianService:
             operations.append(operation)
         return operations
 
-    def _extract_scope_entity_ids(
+    async def _load_world_canon(
         self,
-        note_title: str | None,
-        note_content: str | None,
-        entities: list[dict],
-    ) -> set[str]:
-        text = _normalize_identity(f"{note_title or ''}\n{note_content or ''}")
-        if not text:
+        db: aiosqlite.Connection,
+        world_id: str,
+    ) -> tuple[frozenset[str], list[dict], list[dict], list[aiosqlite.Row], list[dict]]:
+        """Load note ids, entities, relations, markers and operations for one world.
+
+        The SELECTs are queued together so the connection's worker thread
+        runs them back to back instead of waiting on each round-trip.
+        """
+        note_ids, entities, relations, markers, operations = await asyncio.gather(
+            self._list_note_ids(db, world_id),
+            self._list_entities(db, world_id),
+            self._list_relations(db, world_id),
+            self._list_markers(db, world_id),
+            self._list_operations(db, world_id),
+        )
+        return note_ids, entities, relations, markers, operations
+
+    def _extract_scope_entity_ids(self, norm_text: str, entities: list[dict]) -> set[str]:
+        if not norm_text:
             return set()
-        scope: set[str] = set()
+        phrase_owners: dict[str, set[str]] = defaultdict(set)
         for entity in entities:
-            candidates = [entity.get("name") or ""]
-            candidates.extend(entity.get("aliases") or [])
-            candidates = sorted({candidate for candidate in candidates if candidate}, key=len, reverse=True)
-            for candidate in candidates:
-                if _phrase_in_text(text, candidate):
-                    scope.add(entity["id"])
+            for phrase in (entity["_norm_name"], *entity["_norm_aliases"]):
+                if len(phrase) >= 2:
+                    phrase_owners[phrase].add(entity["id"])
+        if not phrase_owners:
+            return set()
+
+        # One pass over the text finds the longest phrase at each position; any
+        # shorter phrase occurring there is a prefix of it, so expand by prefix.
+        matcher = _compile_phrase_matcher(tuple(sorted(phrase_owners)))
+        lengths = sorted({len(phrase) for phrase in phrase_owners})
+        scope: set[str] = set()
+        for longest in {match.group(1) for match in matcher.finditer(norm_text)}:
+            for length in lengths:
+                if length > len(longest):
                     break
+                owners = phrase_owners.get(longest[:length])
+                if owners:
+                    scope.update(owners)
         return scope
 
     def _new_finding(
@@ -266,8 +414,10 @@ class CanonGuardianService:
         detail: str,
         confidence: float,
         evidence: list[dict[str, str]],
-    ) -> GuardianFinding:
-        return GuardianFinding(
+        now: str | None = None,
+    ) -> _FindingDraft:
+        timestamp = now or _now()
+        return _FindingDraft(
             id=str(uuid4()),
             run_id=run_id,
             world_id=world_id,
@@ -276,11 +426,9 @@ class CanonGuardianService:
             title=title,
             detail=detail,
             confidence=confidence,
-            resolution_status="open",
-            evidence=[GuardianEvidenceRef(**entry) for entry in evidence],
-            suggested_action_count=0,
-            created_at=_now(),
-            updated_at=_now(),
+            evidence=evidence,
+            created_at=timestamp,
+            updated_at=timestamp,
         )
 
     def _new_action(
@@ -295,21 +443,22 @@ class CanonGuardianService:
         target_kind: str | None = None,
         target_id: str | None = None,
         payload: dict[str, Any] | None = None,
-    ) -> GuardianAction:
-        return GuardianAction(
+        now: str | None = None,
+    ) -> _ActionDraft:
+        timestamp = now or _now()
+        return _ActionDraft(
             id=str(uuid4()),
             run_id=run_id,
             finding_id=finding_id,
             world_id=world_id,
-            action_type=action_type,  # type: ignore[arg-type]
+            action_type=action_type,
             op_type=op_type,
             target_kind=target_kind,
             target_id=target_id,
             payload=payload or {},
             rationale=rationale,
-            status="proposed",
-            created_at=_now(),
-            updated_at=_now(),
+            created_at=timestamp,
+            updated_at=timestamp,
         )
 
     def _is_in_scope(self, scope_entity_ids: set[str], *entity_ids: str | None) -> bool:
@@ -329,9 +478,9 @@ class CanonGuardianService:
         note_content: str | None,
         entities: list[dict],
         relations: list[dict],
-        markers: list[dict],
+        markers: list[aiosqlite.Row],
         operations: list[dict],
-    ) -> tuple[list[GuardianFinding], list[GuardianAction], dict[str, Any]]:
+    ) -> tuple[list[_FindingDraft], list[_ActionDraft], dict[str, Any]]:
         logger.info(
             "[TEMP][CANON][hard] start run_id=%s world_id=%s entities=%d relations=%d markers=%d operations=%d",
             run_id,
@@ -341,30 +490,43 @@ class CanonGuardianService:
             len(markers),
             len(operations),
         )
-        findings: list[GuardianFinding] = []
-        actions: list[GuardianAction] = []
+        findings: list[_FindingDraft] = []
+        actions: list[_ActionDraft] = []
+        now = _now()
 
         entity_by_id = {entity["id"]: entity for entity in entities}
         relation_by_id = {relation["id"]: relation for relation in relations}
-        scope_entity_ids = self._extract_scope_entity_ids(note_title, note_content, entities)
-
-        identity_map: dict[str, set[str]] = defaultdict(set)
+        inactive_ids = {entity["id"] for entity in entities if entity["_norm_status"] in INACTIVE_ENTITY_STATUSES}
+        norm_text = _normalize_identity(f"{note_title or ''}\n{note_content or ''}")
+        scope_entity_ids = self._extract_scope_entity_ids(norm_text, entities)
+
+        # A scoped run only reports identity keys held by an in-scope entity, so
+        # keys outside that set never need to be collected.
+        scope_identity_keys: set[str] | None = None
+        if scope_entity_ids:
+            scope_identity_keys = set()
+            for entity in entities:
+                if entity["id"] in scope_entity_ids:
+                    scope_identity_keys.add(entity["_norm_name"])
+                    scope_identity_keys.update(entity["_norm_aliases"])
+
+        # Lists are cheaper to fill than sets; ids are deduplicated only for the
+        # few keys that end up with two or more entries.
+        identity_map: dict[str, list[str]] = {}
         for entity in entities:
-            identity_map[_normalize_identity(entity.get("name"))].add(entity["id"])
-            for alias in entity.get("aliases") or []:
-                alias_key = _normalize_identity(alias)
-                if alias_key:
-                    identity_map[alias_key].add(entity["id"])
+            for identity_key in (entity["_norm_name"], *entity["_norm_aliases"]):
+                if identity_key and (scope_identity_keys is None or identity_key in scope_identity_keys):
+                    identity_map.setdefault(identity_key, []).append(entity["id"])
 
         # Collapse overlapping identity keys into one finding per connected entity cluster.
         candidate_identities: dict[str, set[str]] = {}
         for identity, entity_ids in identity_map.items():
-            normalized_ids = set(entity_ids)
-            if not identity or len(normalized_ids) < 2:
+            if len(entity_ids) < 2:
                 continue
-            if scope_entity_ids and not normalized_ids.intersection(scope_entity_ids):
+            unique_ids = set(entity_ids)
+            if len(unique_ids) < 2:
                 continue
-            candidate_identities[identity] = normalized_ids
+            candidate_identities[identity] = unique_ids
 
         if candidate_identities:
             entity_neighbors: dict[str, set[str]] = defaultdict(set)
@@ -416,6 +578,7 @@ class CanonGuardianService:
                 finding = self._new_finding(
                     run_id=run_id,
                     world_id=world_id,
+                    now=now,
                     severity="high",
                     code="duplicate_entity_identity",
                     title="Multiple entities share overlapping identity keys",
@@ -434,77 +597,148 @@ class CanonGuardianService:
                     self._new_action(
                         run_id=run_id,
                         world_id=world_id,
+                        now=now,
                         finding_id=finding.id,
                         action_type="noop",
                         rationale="Manual merge/disambiguation recommended for overlapping identity clusters.",
                     )
                 )
 
-        for relation in relations:
-            source = entity_by_id.get(relation["source_entity_id"])
-            target = entity_by_id.get(relation["target_entity_id"])
-            if not source or not target:
-                continue
-            if not self._is_in_scope(scope_entity_ids, source["id"], target["id"]):
-                continue
-            source_status = _normalize_identity(source.get("status"))
-            target_status = _normalize_identity(target.get("status"))
-            if source_status not in INACTIVE_ENTITY_STATUSES and target_status not in INACTIVE_ENTITY_STATUSES:
+        # 2) + 3) One sweep over relations: inactive participants and type/weight
+        # schema checks, plus the aggregates used by the duplicate/conflict rules.
+        # Per-rule buffers keep findings in the same order as separate passes would.
+        inactive_findings: list[_FindingDraft] = []
+        inactive_actions: list[_ActionDraft] = []
+        relation_schema_findings: list[_FindingDraft] = []
+        relation_schema_actions: list[_ActionDraft] = []
+        relation_triplets: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
+        # Directed pairs in first-seen order; per-type rows live in relation_triplets.
+        relation_pairs: dict[tuple[str, str], None] = {}
+        # Every relation rule reports a pair only when either endpoint is in scope, so
+        # on note-scoped runs only the relations touching the scope are visited.
+        if scope_entity_ids:
+            scoped_relations = [
+                relation for relation in relations
+                if relation["source_entity_id"] in scope_entity_ids or relation["target_entity_id"] in scope_entity_ids
+            ]
+        else:
+            scoped_relations = relations
+        for relation in scoped_relations:
+            source_id = relation["source_entity_id"]
+            target_id = relation["target_entity_id"]
+            relation_type = relation["_norm_type"]
+            relation_triplets[(source_id, target_id, relation_type)].append(relation)
+            relation_pairs[(source_id, target_id)] = None
+
+            raw_relation_type = relation.get("type") or ""
+            weight = relation.get("weight")
+            weight_out_of_range = isinstance(weight, (int, float)) and not (0.0 <= float(weight) <= 1.0)
+            touches_inactive = source_id in inactive_ids or target_id in inactive_ids
+            if not touches_inactive and not weight_out_of_range and raw_relation_type == relation_type:
                 continue
-            finding = self._new_finding(
-                run_id=run_id,
-                world_id=world_id,
-                severity="high",
-                code="inactive_entity_in_relation",
-                title="Inactive/deceased entity participates in an active relation",
-                detail=(
-                    f"Relation '{relation['type']}' links '{source['name']}' ({source['status']}) "
-                    f"to '{target['name']}' ({target['status']})."
-                ),
-                confidence=1.0,
-                evidence=[
-                    {"kind": "relation", "id": relation["id"]},
-                    {"kind": "entity", "id": source["id"]},
-                    {"kind": "entity", "id": target["id"]},
-                ],
-            )
-            findings.append(finding)
-            actions.append(
-                self._new_action(
+
+            source = entity_by_id.get(source_id)
+            target = entity_by_id.get(target_id)
+            if touches_inactive and source and target:
+                finding = self._new_finding(
                     run_id=run_id,
                     world_id=world_id,
-                    finding_id=finding.id,
-                    action_type="relation_patch",
-                    target_kind="relation",
-                    target_id=relation["id"],
-                    payload={"review": "Confirm historical vs active relation semantics."},
-                    rationale="Mark relation as historical or adjust entity status.",
+                    now=now,
+                    severity="high",
+                    code="inactive_entity_in_relation",
+                    title="Inactive/deceased entity participates in an active relation",
+                    detail=(
+                        f"Relation '{relation['type']}' links '{source['name']}' ({source['status']}) "
+                        f"to '{target['name']}' ({target['status']})."
+                    ),
+                    confidence=1.0,
+                    evidence=[
+                        {"kind": "relation", "id": relation["id"]},
+                        {"kind": "entity", "id": source["id"]},
+                        {"kind": "entity", "id": target["id"]},
+                    ],
+                )
+                inactive_findings.append(finding)
+                inactive_actions.append(
+                    self._new_action(
+                        run_id=run_id,
+                        world_id=world_id,
+                        now=now,
+                        finding_id=finding.id,
+                        action_type="relation_patch",
+                        target_kind="relation",
+                        target_id=relation["id"],
+                        payload={"review": "Confirm historical vs active relation semantics."},
+                        rationale="Mark relation as historical or adjust entity status.",
+                    )
                 )
-            )
 
-        # 3) Conflicting or duplicate relation semantics.
-        relation_triplets: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
-        relation_pairs: dict[tuple[str, str], dict[str, list[dict]]] = defaultdict(lambda: defaultdict(list))
-        for relation in relations:
-            relation_type = normalize_type(relation.get("type") or "")
-            triplet_key = (
-                relation["source_entity_id"],
-                relation["target_entity_id"],
-                relation_type,
-            )
-            relation_triplets[triplet_key].append(relation)
-            relation_pairs[(relation["source_entity_id"], relation["target_entity_id"])][relation_type].append(relation)
+            if raw_relation_type != relation_type:
+                finding = self._new_finding(
+                    run_id=run_id,
+                    world_id=world_id,
+                    now=now,
+                    severity="low",
+                    code="unnormalized_relation_type",
+                    title="Relation type is not normalized",
+                    detail=f"Relation '{relation['id']}' has type '{raw_relation_type}', expected '{relation_type}'.",
+                    confidence=1.0,
+                    evidence=[{"kind": "relation", "id": relation["id"]}],
+                )
+                relation_schema_findings.append(finding)
+                relation_schema_actions.append(
+                    self._new_action(
+                        run_id=run_id,
+                        world_id=world_id,
+                        now=now,
+                        finding_id=finding.id,
+                        action_type="relation_patch",
+                        target_kind="relation",
+                        target_id=relation["id"],
+                        payload={"type": relation_type},
+                        rationale="Normalize relation type casing/spacing.",
+                    )
+                )
+
+            if weight_out_of_range:
+                finding = self._new_finding(
+                    run_id=run_id,
+                    world_id=world_id,
+                    now=now,
+                    severity="high",
+                    code="relation_weight_out_of_range",
+                    title="Relation weight out of range",
+                    detail=f"Relation '{relation['id']}' has weight {weight}; expected 0.0..1.0.",
+                    confidence=1.0,
+                    evidence=[{"kind": "relation", "id": relation["id"]}],
+                )
+                relation_schema_findings.append(finding)
+                relation_schema_actions.append(
+                    self._new_action(
+                        run_id=run_id,
+                        world_id=world_id,
+                        now=now,
+                        finding_id=finding.id,
+                        action_type="relation_patch",
+                        target_kind="relation",
+                        target_id=relation["id"],
+                        payload={"weight": max(0.0, min(1.0, float(weight)))},
+                        rationale="Clamp relation weight to valid range.",
+                    )
+                )
+
+        findings.extend(inactive_findings)
+        actions.extend(inactive_actions)
 
         for (source_id, target_id, relation_type), rows in relation_triplets.items():
             if len(rows) <= 1:
                 continue
-            if not self._is_in_scope(scope_entity_ids, source_id, target_id):
-                continue
             source_name = entity_by_id.get(source_id, {}).get("name", source_id)
             target_name = entity_by_id.get(target_id, {}).get("name", target_id)
             finding = self._new_finding(
                 run_id=run_id,
                 world_id=world_id,
+                now=now,
                 severity="medium",
                 code="duplicate_relation_edge",
                 title="Duplicate relation edges detected",
@@ -517,6 +751,7 @@ class CanonGuardianService:
                 self._new_action(
                     run_id=run_id,
                     world_id=world_id,
+                    now=now,
                     finding_id=finding.id,
                     action_type="relation_patch",
                     target_kind="relation",
@@ -527,19 +762,20 @@ class CanonGuardianService:
             )
 
         contradictory_pairs = [("ally_of", "enemy_of"), ("parent_of", "child_of")]
-        for (source_id, target_id), by_type in relation_pairs.items():
-            if not self._is_in_scope(scope_entity_ids, source_id, target_id):
-                continue
+        for source_id, target_id in relation_pairs:
             for left, right in contradictory_pairs:
-                if left not in by_type or right not in by_type:
+                left_rows = relation_triplets.get((source_id, target_id, left))
+                right_rows = relation_triplets.get((source_id, target_id, right))
+                if not left_rows or not right_rows:
                     continue
-                left_rel = by_type[left][0]
-                right_rel = by_type[right][0]
+                left_rel = left_rows[0]
+                right_rel = right_rows[0]
                 source_name = entity_by_id.get(source_id, {}).get("name", source_id)
                 target_name = entity_by_id.get(target_id, {}).get("name", target_id)
                 finding = self._new_finding(
                     run_id=run_id,
                     world_id=world_id,
+                    now=now,
                     severity="high",
                     code="conflicting_relation_types",
                     title="Conflicting relation types on same directed pair",
@@ -555,27 +791,30 @@ class CanonGuardianService:
                     self._new_action(
                         run_id=run_id,
                         world_id=world_id,
+                        now=now,
                         finding_id=finding.id,
                         action_type="noop",
                         rationale="Resolve contradictory relation semantics manually.",
                     )
                 )
 
-        parent_edges = {(src, tgt) for (src, tgt), types in relation_pairs.items() if "parent_of" in types}
-        for source_id, target_id in sorted(parent_edges):
-            if (target_id, source_id) not in parent_edges:
-                continue
-            if source_id > target_id:
-                continue
-            if not self._is_in_scope(scope_entity_ids, source_id, target_id):
-                continue
+        parent_edges = {pair for pair in relation_pairs if (*pair, "parent_of") in relation_triplets}
+        # Only the canonical direction of each cycle is sorted, which keeps the
+        # (source_id, target_id) finding order without sorting every edge.
+        cyclic_pairs = sorted(
+            (source_id, target_id)
+            for source_id, target_id in parent_edges
+            if source_id <= target_id and (target_id, source_id) in parent_edges
+        )
+        for source_id, target_id in cyclic_pairs:
             source_name = entity_by_id.get(source_id, {}).get("name", source_id)
             target_name = entity_by_id.get(target_id, {}).get("name", target_id)
-            forward_id = relation_pairs[(source_id, target_id)]["parent_of"][0]["id"]
-            reverse_id = relation_pairs[(target_id, source_id)]["parent_of"][0]["id"]
+            forward_id = relation_triplets[(source_id, target_id, "parent_of")][0]["id"]
+            reverse_id = relation_triplets[(target_id, source_id, "parent_of")][0]["id"]
             finding = self._new_finding(
                 run_id=run_id,
                 world_id=world_id,
+                now=now,
                 severity="critical",
                 code="cyclic_parent_relation",
                 title="Cyclic parent_of relationship detected",
@@ -591,6 +830,7 @@ class CanonGuardianService:
                 self._new_action(
                     run_id=run_id,
                     world_id=world_id,
+                    now=now,
                     finding_id=finding.id,
                     action_type="noop",
                     rationale="Keep only one parent_of direction and convert inverse to child_of if needed.",
@@ -599,7 +839,7 @@ class CanonGuardianService:
 
         # 4) Type/schema validations on canonical tables.
         for entity in entities:
-            normalized_type = normalize_type(entity.get("type") or "")
+            normalized_type = entity["_norm_type"]
             raw_type = entity.get("type") or ""
             if raw_type != normalized_type:
                 if not self._is_in_scope(scope_entity_ids, entity["id"]):
@@ -607,6 +847,7 @@ class CanonGuardianService:
                 finding = self._new_finding(
                     run_id=run_id,
                     world_id=world_id,
+                    now=now,
                     severity="low",
                     code="unnormalized_entity_type",
                     title="Entity type is not normalized",
@@ -619,6 +860,7 @@ class CanonGuardianService:
                     self._new_action(
                         run_id=run_id,
                         world_id=world_id,
+                        now=now,
                         finding_id=finding.id,
                         action_type="entity_patch",
                         target_kind="entity",
@@ -628,82 +870,24 @@ class CanonGuardianService:
                     )
                 )
 
-        for relation in relations:
-            normalized_relation_type = normalize_type(relation.get("type") or "")
-            raw_relation_type = relation.get("type") or ""
-            if raw_relation_type != normalized_relation_type:
-                source_id = relation.get("source_entity_id")
-                target_id = relation.get("target_entity_id")
-                if not self._is_in_scope(scope_entity_ids, source_id, target_id):
-                    continue
-                finding = self._new_finding(
-                    run_id=run_id,
-                    world_id=world_id,
-                    severity="low",
-                    code="unnormalized_relation_type",
-                    title="Relation type is not normalized",
-                    detail=f"Relation '{relation['id']}' has type '{raw_relation_type}', expected '{normalized_relation_type}'.",
-                    confidence=1.0,
-                    evidence=[{"kind": "relation", "id": relation["id"]}],
-                )
-                findings.append(finding)
-                actions.append(
-                    self._new_action(
-                        run_id=run_id,
-                        world_id=world_id,
-                        finding_id=finding.id,
-                        action_type="relation_patch",
-                        target_kind="relation",
-                        target_id=relation["id"],
-                        payload={"type": normalized_relation_type},
-                        rationale="Normalize relation type casing/spacing.",
-                    )
-                )
-
-            weight = relation.get("weight")
-            if isinstance(weight, (int, float)) and not (0.0 <= float(weight) <= 1.0):
-                source_id = relation.get("source_entity_id")
-                target_id = relation.get("target_entity_id")
-                if not self._is_in_scope(scope_entity_ids, source_id, target_id):
-                    continue
-                finding = self._new_finding(
-                    run_id=run_id,
-                    world_id=world_id,
-                    severity="high",
-                    code="relation_weight_out_of_range",
-                    title="Relation weight out of range",
-                    detail=f"Relation '{relation['id']}' has weight {weight}; expected 0.0..1.0.",
-                    confidence=1.0,
-                    evidence=[{"kind": "relation", "id": relation["id"]}],
-                )
-                findings.append(finding)
-                actions.append(
-                    self._new_action(
-                        run_id=run_id,
-                        world_id=world_id,
-                        finding_id=finding.id,
-                        action_type="relation_patch",
-                        target_kind="relation",
-                        target_id=relation["id"],
-                        payload={"weight": max(0.0, min(1.0, float(weight)))},
-                        rationale="Clamp relation weight to valid range.",
-                    )
-                )
+        findings.extend(relation_schema_findings)
+        actions.extend(relation_schema_actions)
 
         # 5) Timeline ordering and operation schema conflicts.
-        explicit_markers = [marker for marker in markers if normalize_type(marker.get("marker_kind") or "") == "explicit"]
-        previous_explicit_with_date: dict | None = None
+        explicit_markers = [marker for marker in markers if normalize_type(marker["marker_kind"] or "") == "explicit"]
+        previous_explicit_with_date: aiosqlite.Row | None = None
         for marker in explicit_markers:
             marker_id = marker["id"]
-            has_date = marker.get("date_sort_value") is not None
+            has_date = marker["date_sort_value"] is not None
             if not has_date:
                 finding = self._new_finding(
                     run_id=run_id,
                     world_id=world_id,
+                    now=now,
                     severity="medium",
                     code="explicit_marker_missing_date_sort",
                     title="Explicit marker missing date_sort_value",
-                    detail=f"Marker '{marker.get('title') or marker_id}' is explicit but has no numeric date_sort_value.",
+                    detail=f"Marker '{marker['title'] or marker_id}' is explicit but has no numeric date_sort_value.",
                     confidence=1.0,
                     evidence=[{"kind": "timeline_marker", "id": marker_id}],
                 )
@@ -712,6 +896,7 @@ class CanonGuardianService:
                     self._new_action(
                         run_id=run_id,
                         world_id=world_id,
+                        now=now,
                         finding_id=finding.id,
                         action_type="noop",
                         rationale="Provide numeric date_sort_value for explicit chronology.",
@@ -726,12 +911,13 @@ class CanonGuardianService:
                     finding = self._new_finding(
                         run_id=run_id,
                         world_id=world_id,
+                        now=now,
                         severity="high",
                         code="timeline_explicit_order_conflict",
                         title="Explicit timeline order conflicts with date_sort_value",
                         detail=(
-                            f"Marker '{marker.get('title')}' ({current_value}) appears after "
-                            f"'{previous_explicit_with_date.get('title')}' ({prev_value}) by sort_key."
+                            f"Marker '{marker['title']}' ({current_value}) appears after "
+                            f"'{previous_explicit_with_date['title']}' ({prev_value}) by sort_key."
                         ),
                         confidence=1.0,
                         evidence=[
@@ -744,6 +930,7 @@ class CanonGuardianService:
                         self._new_action(
                             run_id=run_id,
                             world_id=world_id,
+                            now=now,
                             finding_id=finding.id,
                             action_type="noop",
                             rationale="Reposition markers to align sort_key with date_sort_value.",
@@ -751,112 +938,99 @@ class CanonGuardianService:
                     )
             previous_explicit_with_date = marker
 
+        def emit(severity: str, code: str, title: str, detail: str, evidence: list[dict[str, str]]) -> None:
+            # Op-sweep findings share run, world, timestamp and confidence, so
+            # build the draft directly instead of going through _new_finding.
+            findings.append(
+                _FindingDraft(
+                    id=str(uuid4()),
+                    run_id=run_id,
+                    world_id=world_id,
+                    severity=severity,
+                    finding_code=code,
+                    title=title,
+                    detail=detail,
+                    confidence=1.0,
+                    evidence=evidence,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+
         for operation in operations:
-            target_kind = operation.get("target_kind") or ""
-            op_type = operation.get("op_type") or ""
-            payload = operation.get("payload") if isinstance(operation.get("payload"), dict) else {}
+            # _list_operations guarantees every column key and normalised strings.
+            target_kind = operation["target_kind"]
+            op_type = operation["op_type"]
+            payload = operation["payload"]
+            if not isinstance(payload, dict):
+                payload = {}
             op_id = operation["id"]
             marker_id = operation["marker_id"]
 
             if target_kind == "entity" and op_type not in ENTITY_OPS:
-                findings.append(
-                    self._new_finding(
-                        run_id=run_id,
-                        world_id=world_id,
-                        severity="high",
-                        code="invalid_timeline_entity_op_type",
-                        title="Invalid entity timeline operation type",
-                        detail=f"Operation '{op_id}' has unsupported entity op_type '{op_type}'.",
-                        confidence=1.0,
-                        evidence=[{"kind": "timeline_operation", "id": op_id}, {"kind": "timeline_marker", "id": marker_id}],
-                    )
+                emit(
+                    "high",
+                    "invalid_timeline_entity_op_type",
+                    "Invalid entity timeline operation type",
+                    f"Operation '{op_id}' has unsupported entity op_type '{op_type}'.",
+                    [{"kind": "timeline_operation", "id": op_id}, {"kind": "timeline_marker", "id": marker_id}],
                 )
                 continue
             if target_kind == "relation" and op_type not in RELATION_OPS:
-                findings.append(
-                    self._new_finding(
-                        run_id=run_id,
-                        world_id=world_id,
-                        severity="high",
-                        code="invalid_timeline_relation_op_type",
-                        title="Invalid relation timeline operation type",
-                        detail=f"Operation '{op_id}' has unsupported relation op_type '{op_type}'.",
-                        confidence=1.0,
-                        evidence=[{"kind": "timeline_operation", "id": op_id}, {"kind": "timeline_marker", "id": marker_id}],
-                    )
+                emit(
+                    "high",
+                    "invalid_timeline_relation_op_type",
+                    "Invalid relation timeline operation type",
+                    f"Operation '{op_id}' has unsupported relation op_type '{op_type}'.",
+                    [{"kind": "timeline_operation", "id": op_id}, {"kind": "timeline_marker", "id": marker_id}],
                 )
                 continue
             if target_kind == "world" and op_type not in WORLD_OPS:
-                findings.append(
-                    self._new_finding(
-                        run_id=run_id,
-                        world_id=world_id,
-                        severity="high",
-                        code="invalid_timeline_world_op_type",
-                        title="Invalid world timeline operation type",
-                        detail=f"Operation '{op_id}' has unsupported world op_type '{op_type}'.",
-                        confidence=1.0,
-                        evidence=[{"kind": "timeline_operation", "id": op_id}, {"kind": "timeline_marker", "id": marker_id}],
-                    )
+                emit(
+                    "high",
+                    "invalid_timeline_world_op_type",
+                    "Invalid world timeline operation type",
+                    f"Operation '{op_id}' has unsupported world op_type '{op_type}'.",
+                    [{"kind": "timeline_operation", "id": op_id}, {"kind": "timeline_marker", "id": marker_id}],
                 )
                 continue
 
-            target_id = operation.get("target_id")
+            target_id = operation["target_id"]
             if target_kind == "entity":
                 if target_id and target_id not in entity_by_id:
-                    findings.append(
-                        self._new_finding(
-                            run_id=run_id,
-                            world_id=world_id,
-                            severity="high",
-                            code="timeline_entity_target_missing",
-                            title="Timeline operation references missing entity target",
-                            detail=f"Operation '{op_id}' targets unknown entity '{target_id}'.",
-                            confidence=1.0,
-                            evidence=[{"kind": "timeline_operation", "id": op_id}],
-                        )
+                    emit(
+                        "high",
+                        "timeline_entity_target_missing",
+                        "Timeline operation references missing entity target",
+                        f"Operation '{op_id}' targets unknown entity '{target_id}'.",
+                        [{"kind": "timeline_operation", "id": op_id}],
                     )
                 if not target_id and not payload.get("id") and not payload.get("name"):
-                    findings.append(
-                        self._new_finding(
-                            run_id=run_id,
-                            world_id=world_id,
-                            severity="medium",
-                            code="timeline_entity_target_ambiguous",
-                            title="Entity timeline operation lacks target reference",
-                            detail=f"Operation '{op_id}' has no target_id or payload.name/id to resolve entity.",
-                            confidence=1.0,
-                            evidence=[{"kind": "timeline_operation", "id": op_id}],
-                        )
+                    emit(
+                        "medium",
+                        "timeline_entity_target_ambiguous",
+                        "Entity timeline operation lacks target reference",
+                        f"Operation '{op_id}' has no target_id or payload.name/id to resolve entity.",
+                        [{"kind": "timeline_operation", "id": op_id}],
                     )
             elif target_kind == "relation":
                 if target_id and target_id not in relation_by_id:
-                    findings.append(
-                        self._new_finding(
-                            run_id=run_id,
-                            world_id=world_id,
-                            severity="high",
-                            code="timeline_relation_target_missing",
-                            title="Timeline operation references missing relation target",
-                            detail=f"Operation '{op_id}' targets unknown relation '{target_id}'.",
-                            confidence=1.0,
-                            evidence=[{"kind": "timeline_operation", "id": op_id}],
-                        )
+                    emit(
+                        "high",
+                        "timeline_relation_target_missing",
+                        "Timeline operation references missing relation target",
+                        f"Operation '{op_id}' targets unknown relation '{target_id}'.",
+                        [{"kind": "timeline_operation", "id": op_id}],
                     )
-                if op_type in {"relation_create", "relation_patch", "relation_add", "relation_update", "relation_modify"} and not target_id:
-                    missing_fields = [key for key in ("source_entity_id", "target_entity_id", "type") if not payload.get(key)]
+                if op_type in RELATION_TARGET_REQUIRED_OPS and not target_id:
+                    missing_fields = [key for key in RELATION_PAYLOAD_REQUIRED_FIELDS if not payload.get(key)]
                     if missing_fields:
-                        findings.append(
-                            self._new_finding(
-                                run_id=run_id,
-                                world_id=world_id,
-                                severity="medium",
-                                code="timeline_relation_payload_incomplete",
-                                title="Relation timeline operation payload is incomplete",
-                                detail=f"Operation '{op_id}' without target_id is missing fields: {', '.join(missing_fields)}.",
-                                confidence=1.0,
-                                evidence=[{"kind": "timeline_operation", "id": op_id}],
-                            )
+                        emit(
+                            "medium",
+                            "timeline_relation_payload_incomplete",
+                            "Relation timeline operation payload is incomplete",
+                            f"Operation '{op_id}' without target_id is missing fields: {', '.join(missing_fields)}.",
+                            [{"kind": "timeline_operation", "id": op_id}],
                         )
 
         summary = {
@@ -879,28 +1053,19 @@ class CanonGuardianService:
         )
         return findings, actions, summary
 
-    async def _store_findings_and_actions(
+    def _persist_rows(
         self,
-        db: aiosqlite.Connection,
-        world_id: str,
         run_id: str,
-        findings: list[GuardianFinding],
-        actions: list[GuardianAction],
-    ) -> None:
-        await db.execute("DELETE FROM guardian_actions WHERE world_id = ? AND run_id = ?", (world_id, run_id))
-        await db.execute("DELETE FROM guardian_findings WHERE world_id = ? AND run_id = ?", (world_id, run_id))
-
-        action_counts: dict[str, int] = defaultdict(int)
-        for action in actions:
-            if action.finding_id:
-                action_counts[action.finding_id] += 1
+        findings: list[_FindingDraft],
+        actions: list[_ActionDraft],
+    ) -> tuple[list[tuple], list[tuple]]:
+        """Build guardian_findings/guardian_actions rows, stamping suggested_action_count."""
+        action_counts = Counter(action.finding_id for action in actions if action.finding_id)
 
+        finding_rows = []
         for finding in findings:
             finding.suggested_action_count = action_counts.get(finding.id, 0)
-            await db.execute(
-                """INSERT INTO guardian_findings
-                   (id, run_id, world_id, severity, finding_code, title, detail, confidence, resolution_status, evidence_json, suggested_action_count, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            finding_rows.append(
                 (
                     finding.id,
                     finding.run_id,
@@ -911,13 +1076,14 @@ class CanonGuardianService:
                     finding.detail,
                     float(finding.confidence),
                     finding.resolution_status,
-                    json.dumps([entry.model_dump() for entry in finding.evidence]),
+                    _dump_json(finding.evidence),
                     int(finding.suggested_action_count),
                     str(finding.created_at),
                     str(finding.updated_at),
-                ),
+                )
             )
 
+        action_rows = []
         for action in actions:
             normalized_target_kind = normalize_type(action.target_kind or "")
             db_target_kind = normalized_target_kind if normalized_target_kind in {"entity", "relation", "world"} else None
@@ -929,10 +1095,7 @@ class CanonGuardianService:
                     action.id,
                     action.target_kind,
                 )
-            await db.execute(
-                """INSERT INTO guardian_actions
-                   (id, run_id, finding_id, world_id, action_type, op_type, target_kind, target_id, payload, rationale, status, error, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            action_rows.append(
                 (
                     action.id,
                     action.run_id,
@@ -942,167 +1105,208 @@ class CanonGuardianService:
                     action.op_type,
                     db_target_kind,
                     db_target_id,
-                    json.dumps(action.payload),
+                    _dump_json(action.payload),
                     action.rationale,
                     action.status,
                     action.error,
                     str(action.created_at),
                     str(action.updated_at),
-                ),
+                )
             )
 
+        return finding_rows, action_rows
+
+    async def _insert_rows(
+        self,
+        db: aiosqlite.Connection,
+        finding_rows: list[tuple],
+        action_rows: list[tuple],
+    ) -> None:
+        await db.executemany(
+            """INSERT INTO guardian_findings
+               (id, run_id, world_id, severity, finding_code, title, detail, confidence, resolution_status, evidence_json, suggested_action_count, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            finding_rows,
+        )
+        await db.executemany(
+            """INSERT INTO guardian_actions
+               (id, run_id, finding_id, world_id, action_type, op_type, target_kind, target_id, payload, rationale, status, error, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            action_rows,
+        )
+
+    async def _persist_run(
+        self,
+        world_id: str,
+        run_id: str,
+        findings: list[_FindingDraft],
+        actions: list[_ActionDraft],
+        *,
+        summary: dict[str, Any],
+    ) -> None:
+        """Replace a run's findings and actions and mark it completed, in one write transaction."""
+        finding_rows, action_rows = self._persist_rows(run_id, findings, actions)
+        async with self._db.write_transaction() as db:
+            await db.execute("DELETE FROM guardian_actions WHERE world_id = ? AND run_id = ?", (world_id, run_id))
+            await db.execute("DELETE FROM guardian_findings WHERE world_id = ? AND run_id = ?", (world_id, run_id))
+            await self._insert_rows(db, finding_rows, action_rows)
+            await self._finalize_run(db, world_id, run_id, status="completed", summary=summary, error=None)
+
+    async def _finalize_run(
+        self,
+        db: aiosqlite.Connection,
+        world_id: str,
+        run_id: str,
+        *,
+        status: str,
+        summary: dict[str, Any] | None,
+        error: str | None,
+    ) -> None:
+        """Record a run's final status; the caller owns the write transaction."""
+        completed_at = _now()
+        await db.execute(
+            """UPDATE guardian_runs
+               SET status = ?, summary_json = ?, error = ?, completed_at = ?, updated_at = ?
+               WHERE world_id = ? AND id = ?""",
+            (
+                status,
+                _dump_json(summary or {}),
+                error,
+                completed_at,
+                completed_at,
+                world_id,
+                run_id,
+            ),
+        )
+
     def _truncate_to_limit(
         self,
-        findings: list[GuardianFinding],
-        actions: list[GuardianAction],
+        findings: list[_FindingDraft],
+        actions: list[_ActionDraft],
         max_findings: int,
-    ) -> tuple[list[GuardianFinding], list[GuardianAction]]:
+    ) -> tuple[list[_FindingDraft], list[_ActionDraft]]:
         if len(findings) <= max_findings:
             return findings, actions
-        ordered_findings = sorted(
+        # nsmallest is stable like sorted()[:n]. Findings stamped in the same
+        # run tie on created_at and keep their rule emission order; a uuid
+        # tiebreak would make the cut random. O(N log K) instead of a full sort.
+        selected = heapq.nsmallest(
+            max_findings,
             findings,
-            key=lambda finding: (SEVERITY_ORDER.get(finding.severity, 99), str(finding.created_at), finding.id),
+            key=lambda finding: (SEVERITY_ORDER.get(finding.severity, 99), str(finding.created_at)),
         )
-        selected = ordered_findings[:max_findings]
         selected_ids = {finding.id for finding in selected}
         selected_actions = [action for action in actions if not action.finding_id or action.finding_id in selected_ids]
         return selected, selected_actions
 
-    def _finding_code_family(self, code: str) -> str:
-        normalized = normalize_type(code or "")
-        return normalized.removeprefix("soft_")
-
-    def _finding_evidence_signature(self, finding: GuardianFinding) -> tuple[str, ...]:
-        parts = []
-        for item in finding.evidence:
-            parts.append(f"{item.kind}:{item.id}")
-        return tuple(sorted(parts))
-
     def _build_soft_critic_context_pack(
         self,
         *,
-        note_ids: set[str],
+        note_ids: frozenset[str],
         world_id: str,
         entities: list[dict],
         relations: list[dict],
-        markers: list[dict],
+        markers: list[aiosqlite.Row],
         operations: list[dict],
-        hard_findings: list[GuardianFinding],
+        hard_findings: list[_FindingDraft],
         max_context_tokens: int,
-    ) -> tuple[str, dict[str, set[str]], dict[str, Any]]:
+    ) -> tuple[str, dict[str, frozenset[str]], dict[str, Any]]:
         max_chars = max(800, int(max_context_tokens * 4))
-        entity_by_id = {entity["id"]: entity for entity in entities}
-        relation_by_id = {relation["id"]: relation for relation in relations}
-        marker_by_id = {marker["id"]: marker for marker in markers}
-
         scope_ids = {entity["id"] for entity in entities}
 
-        selected_relations = [
-            relation for relation in relations
-            if relation["source_entity_id"] in scope_ids or relation["target_entity_id"] in scope_ids
-        ]
+        # Every loaded entity is in scope, so a relation with both endpoints
+        # among the selected entities already touches the scope; one pass over
+        # relations covers both the neighbour and the relation selection.
         neighbor_ids = set(scope_ids)
-        for relation in selected_relations:
-            neighbor_ids.add(relation["source_entity_id"])
-            neighbor_ids.add(relation["target_entity_id"])
-        selected_entity_ids = {entity_id for entity_id in neighbor_ids if entity_id in entity_by_id}
-
-        selected_relation_ids = {relation["id"] for relation in selected_relations}
+        selected_relations = []
         for relation in relations:
-            if relation["source_entity_id"] in selected_entity_ids and relation["target_entity_id"] in selected_entity_ids:
-                selected_relation_ids.add(relation["id"])
+            source_id = relation["source_entity_id"]
+            target_id = relation["target_entity_id"]
+            if source_id in scope_ids or target_id in scope_ids:
+                selected_relations.append(relation)
+                neighbor_ids.add(source_id)
+                neighbor_ids.add(target_id)
+        selected_entity_ids = neighbor_ids & scope_ids
+        selected_relation_ids = {relation["id"] for relation in selected_relations}
 
-        selected_operation_ids: set[str] = set()
+        # A marker is selected when any of its operations targets a selected
+        # entity or relation; all operations of a selected marker come along.
         selected_marker_ids: set[str] = set()
         for operation in operations:
-            target_kind = operation.get("target_kind")
-            target_id = operation.get("target_id")
-            include = False
-            if target_kind == "entity" and target_id in selected_entity_ids:
-                include = True
-            elif target_kind == "relation" and target_id in selected_relation_ids:
-                include = True
-            elif operation.get("marker_id") in selected_marker_ids:
-                include = True
-            if include:
-                selected_operation_ids.add(operation["id"])
+            target_kind = operation["target_kind"]
+            target_id = operation["target_id"]
+            if (target_kind == "entity" and target_id in selected_entity_ids) or (
+                target_kind == "relation" and target_id in selected_relation_ids
+            ):
                 selected_marker_ids.add(operation["marker_id"])
 
-        for operation in operations:
-            if operation["marker_id"] in selected_marker_ids:
-                selected_operation_ids.add(operation["id"])
-
-        selected_entities = [entity_by_id[entity_id] for entity_id in sorted(selected_entity_ids)]
-        selected_relations = [relation_by_id[rel_id] for rel_id in sorted(selected_relation_ids) if rel_id in relation_by_id]
-        selected_markers = [marker_by_id[marker_id] for marker_id in sorted(selected_marker_ids) if marker_id in marker_by_id]
-        selected_operations = [op for op in operations if op["id"] in selected_operation_ids]
-
-        blocks: list[str] = []
-        blocks.append(f"[world]\n- world_id: {world_id}\n- scan_scope: world")
-
-        entity_lines = []
-        for entity in selected_entities:
-            aliases = ", ".join(entity.get("aliases") or [])
-            entity_lines.append(
-                f"- {entity['id']} | {entity['name']} | type={entity.get('type')} | status={entity.get('status')} | aliases={aliases}"
-            )
-        blocks.append("[entities]\n" + ("\n".join(entity_lines) if entity_lines else "- none"))
+        # Keep the loaders' ordering instead of re-sorting by id.
+        selected_entities = [entity for entity in entities if entity["id"] in selected_entity_ids]
+        selected_markers = [marker for marker in markers if marker["id"] in selected_marker_ids]
+        selected_operations = [op for op in operations if op["marker_id"] in selected_marker_ids]
 
-        relation_lines = []
-        for relation in selected_relations:
-            relation_lines.append(
-                f"- {relation['id']} | {relation['source_entity_id']} -> {relation['target_entity_id']} | type={relation.get('type')} | weight={relation.get('weight')}"
-            )
-        blocks.append("[relations]\n" + ("\n".join(relation_lines) if relation_lines else "- none"))
+        def operation_line(operation: dict) -> str:
+            payload = operation["payload"]
+            payload_keys = ",".join(sorted(payload))[:120] if isinstance(payload, dict) else ""
+            return f"- {operation['id']} | marker={operation['marker_id']} | {operation['target_kind']}:{operation['target_id']} | op={operation['op_type']} | payload_keys={payload_keys}"
 
-        marker_lines = []
-        for marker in selected_markers:
-            marker_lines.append(
-                f"- {marker['id']} | {marker.get('title')} | kind={marker.get('marker_kind')} | date_sort_value={marker.get('date_sort_value')} | sort_key={marker.get('sort_key')}"
-            )
-        blocks.append("[timeline_markers]\n" + ("\n".join(marker_lines) if marker_lines else "- none"))
-
-        operation_lines = []
-        for operation in selected_operations:
-            payload = operation.get("payload") if isinstance(operation.get("payload"), dict) else {}
-            payload_keys = ",".join(sorted(payload.keys()))[:120]
-            operation_lines.append(
-                f"- {operation['id']} | marker={operation['marker_id']} | {operation.get('target_kind')}:{operation.get('target_id')} | op={operation.get('op_type')} | payload_keys={payload_keys}"
-            )
-        blocks.append("[timeline_operations]\n" + ("\n".join(operation_lines) if operation_lines else "- none"))
+        def hard_finding_line(finding: _FindingDraft) -> str:
+            evidence_sig = ", ".join(f"{e['kind']}:{e['id']}" for e in finding.evidence[:3])
+            return f"- {finding.finding_code} | severity={finding.severity} | evidence={evidence_sig}"
 
-        hard_lines = []
-        for finding in hard_findings[:20]:
-            evidence_sig = ", ".join(f"{e.kind}:{e.id}" for e in finding.evidence[:3])
-            hard_lines.append(f"- {finding.finding_code} | severity={finding.severity} | evidence={evidence_sig}")
-        blocks.append("[hard_findings_summary]\n" + ("\n".join(hard_lines) if hard_lines else "- none"))
+        # Section lines are generators so items past the budget are never formatted.
+        sections = (
+            ("[world]", (f"- world_id: {world_id}", "- scan_scope: world")),
+            (
+                "[entities]",
+                (
+                    f"- {entity['id']} | {entity['name']} | type={entity.get('type')} | status={entity.get('status')} | aliases={', '.join(entity.get('aliases') or [])}"
+                    for entity in selected_entities
+                ),
+            ),
+            (
+                "[relations]",
+                (
+                    f"- {relation['id']} | {relation['source_entity_id']} -> {relation['target_entity_id']} | type={relation.get('type')} | weight={relation.get('weight')}"
+                    for relation in selected_relations
+                ),
+            ),
+            (
+                "[timeline_markers]",
+                (
+                    f"- {marker['id']} | {marker['title']} | kind={marker['marker_kind']} | date_sort_value={marker['date_sort_value']} | sort_key={marker['sort_key']}"
+                    for marker in selected_markers
+                ),
+            ),
+            ("[timeline_operations]", map(operation_line, selected_operations)),
+            ("[hard_findings_summary]", map(hard_finding_line, hard_findings[:20])),
+        )
 
-        result_blocks: list[str] = []
+        buf = io.StringIO()
+        # Budget accounting charges every section its length plus a 2-char separator.
         current_chars = 0
-        for block in blocks:
-            if not block:
-                continue
-            block_text = block.strip()
-            if not block_text:
-                continue
-            if current_chars + len(block_text) + 2 > max_chars:
-                remaining = max_chars - current_chars - 2
+        for header, lines in sections:
+            remaining = max_chars - current_chars - 2
+            block_text, complete = _take_section(header, lines, remaining)
+            if not complete:
                 if remaining <= 120:
                     break
                 block_text = block_text[:remaining] + "\n...<truncated>"
-            result_blocks.append(block_text)
+            if current_chars:
+                buf.write("\n\n")
+            buf.write(block_text)
             current_chars += len(block_text) + 2
             if current_chars >= max_chars:
                 break
 
-        context_pack = "\n\n".join(result_blocks)
+        context_pack = buf.getvalue()
         id_registry = {
-            "note": set(note_ids),
-            "entity": {entity["id"] for entity in entities},
-            "relation": {relation["id"] for relation in relations},
-            "timeline_marker": {marker["id"] for marker in markers},
-            "timeline_operation": {operation["id"] for operation in operations},
-            "world": {world_id},
+            "note": frozenset(note_ids),
+            "entity": frozenset(scope_ids),
+            "relation": frozenset(relation["id"] for relation in relations),
+            "timeline_marker": frozenset(marker["id"] for marker in markers),
+            "timeline_operation": frozenset(operation["id"] for operation in operations),
+            "world": frozenset((world_id,)),
         }
         meta = {
             "max_context_tokens": max_context_tokens,
@@ -1123,22 +1327,20 @@ class CanonGuardianService:
         run_id: str,
         world_id: str,
         raw_response: str,
-    ) -> tuple[list[GuardianFinding], list[GuardianAction]]:
-        text = (raw_response or "").strip()
-        if text.startswith("```json"):
-            text = text[7:]
-        elif text.startswith("```"):
-            text = text[3:]
-        if text.endswith("```"):
-            text = text[:-3]
-        text = text.strip()
-        data = json.loads(text)
+    ) -> tuple[list[_FindingDraft], list[_ActionDraft]]:
+        text = raw_response or ""
+        # Slice out the JSON object in one copy; this also drops markdown fences.
+        start = text.find("{")
+        end = text.rfind("}")
+        if start != -1 and end > start:
+            text = text[start : end + 1]
+        data = _parse_json(text)
         records = data.get("soft_findings", [])
         if not isinstance(records, list):
             return [], []
 
-        findings: list[GuardianFinding] = []
-        actions: list[GuardianAction] = []
+        findings: list[_FindingDraft] = []
+        actions: list[_ActionDraft] = []
         for item in records:
             if not isinstance(item, dict):
                 continue
@@ -1146,8 +1348,9 @@ class CanonGuardianService:
             if not code.startswith("soft_"):
                 code = f"soft_{code}" if code else "soft_observation"
             severity = normalize_type(str(item.get("severity") or "low"))
-            if severity not in ALLOWED_SEVERITIES:
-                severity = "low"
+            # Closed-set values parsed from the response are interned so every
+            # finding shares the module's string objects instead of a fresh copy.
+            severity = sys.intern(severity) if severity in ALLOWED_SEVERITIES else "low"
             title = str(item.get("title") or "").strip()
             detail = str(item.get("detail") or "").strip()
             if not title or not detail:
@@ -1165,7 +1368,7 @@ class CanonGuardianService:
                 kind = normalize_type(str(entry.get("kind") or ""))
                 evidence_id = str(entry.get("id") or "").strip()
                 if kind in ALLOWED_EVIDENCE_KINDS and evidence_id:
-                    evidence_entry: dict[str, str] = {"kind": kind, "id": evidence_id}
+                    evidence_entry: dict[str, str] = {"kind": sys.intern(kind), "id": evidence_id}
                     snippet = entry.get("snippet")
                     if snippet is not None:
                         evidence_entry["snippet"] = str(snippet)
@@ -1186,8 +1389,7 @@ class CanonGuardianService:
             suggested_action = item.get("suggested_action")
             if isinstance(suggested_action, dict):
                 action_type = normalize_type(str(suggested_action.get("action_type") or "noop"))
-                if action_type not in ALLOWED_ACTION_TYPES:
-                    action_type = "noop"
+                action_type = sys.intern(action_type) if action_type in ALLOWED_ACTION_TYPES else "noop"
                 target_kind = suggested_action.get("target_kind")
                 if target_kind is not None:
                     target_kind = normalize_type(str(target_kind))
@@ -1217,14 +1419,14 @@ class CanonGuardianService:
     def _validate_soft_findings(
         self,
         *,
-        soft_findings: list[GuardianFinding],
-        soft_actions: list[GuardianAction],
-        existing_findings: list[GuardianFinding],
-        id_registry: dict[str, set[str]],
+        soft_findings: list[_FindingDraft],
+        soft_actions: list[_ActionDraft],
+        existing_findings: list[_FindingDraft],
+        id_registry: dict[str, frozenset[str]],
         confidence_threshold: float = 0.55,
-    ) -> tuple[list[GuardianFinding], list[GuardianAction], dict[str, int]]:
-        accepted_findings: list[GuardianFinding] = []
-        accepted_actions: list[GuardianAction] = []
+    ) -> tuple[list[_FindingDraft], list[_ActionDraft], dict[str, int]]:
+        accepted_findings: list[_FindingDraft] = []
+        accepted_actions: list[_ActionDraft] = []
         rejected = {
             "low_confidence": 0,
             "invalid_evidence": 0,
@@ -1234,7 +1436,7 @@ class CanonGuardianService:
         action_by_finding_id = {action.finding_id: action for action in soft_actions if action.finding_id}
 
         existing_signatures = {
-            (self._finding_code_family(finding.finding_code), self._finding_evidence_signature(finding))
+            (_finding_code_family(finding.finding_code), _evidence_signature(finding.evidence))
             for finding in existing_findings
         }
 
@@ -1247,17 +1449,11 @@ class CanonGuardianService:
                 rejected["invalid_evidence"] += 1
                 continue
 
-            evidence_ok = True
-            for evidence in finding.evidence:
-                valid_ids = id_registry.get(str(evidence.kind), set())
-                if evidence.id not in valid_ids:
-                    evidence_ok = False
-                    break
-            if not evidence_ok:
+            if not all(evidence["id"] in id_registry.get(evidence["kind"], ()) for evidence in finding.evidence):
                 rejected["invalid_evidence"] += 1
                 continue
 
-            signature = (self._finding_code_family(finding.finding_code), self._finding_evidence_signature(finding))
+            signature = (_finding_code_family(finding.finding_code), _evidence_signature(finding.evidence))
             if signature in existing_signatures:
                 rejected["duplicate"] += 1
                 continue
@@ -1265,7 +1461,7 @@ class CanonGuardianService:
             action = action_by_finding_id.get(finding.id)
             if action and action.target_kind and action.target_id:
                 target_kind = normalize_type(action.target_kind)
-                valid_target_ids = id_registry.get(target_kind if target_kind != "marker" else "timeline_marker", set())
+                valid_target_ids = id_registry.get(target_kind if target_kind != "marker" else "timeline_marker", ())
                 if action.target_id not in valid_target_ids:
                     rejected["invalid_action_target"] += 1
                     continue
@@ -1283,15 +1479,15 @@ class CanonGuardianService:
         db: aiosqlite.Connection,
         run_id: str,
         world_id: str,
-        note_ids: set[str],
+        note_ids: frozenset[str],
         entities: list[dict],
         relations: list[dict],
-        markers: list[dict],
+        markers: list[aiosqlite.Row],
         operations: list[dict],
-        hard_findings: list[GuardianFinding],
+        hard_findings: list[_FindingDraft],
         max_context_tokens: int,
-    ) -> tuple[list[GuardianFinding], list[GuardianAction], dict[str, Any]]:
-        if not self.backboard or not self.backboard.is_available:
+    ) -> tuple[list[_FindingDraft], list[_ActionDraft], dict[str, Any]]:
+        if not self.backboard or not self.backboard.available:
             logger.info(
                 "[TEMP][CANON][soft] skipped run_id=%s reason=backboard_unavailable",
                 run_id,
@@ -1407,7 +1603,20 @@ class CanonGuardianService:
     ) -> GuardianScanAccepted:
         run_id = str(uuid4())
         now = _now()
-        request_json = json.dumps(data.model_dump())
+        # Serialise before touching the database so none of it runs under the write lock.
+        run_row = (
+            run_id,
+            world_id,
+            data.trigger_kind,
+            "running",
+            _dump_json(data.model_dump()),
+            None,
+            None,
+            now,
+            None,
+            now,
+            now,
+        )
         logger.info(
             "[TEMP][CANON][scan] start run_id=%s world_id=%s include_soft=%s include_llm=%s dry_run=%s",
             run_id,
@@ -1417,45 +1626,25 @@ class CanonGuardianService:
             data.dry_run,
         )
 
-        db = await self._get_db()
-        try:
-            if not await self._world_exists(db, world_id):
-                raise LookupError("World not found")
+        read_db = await self._db.reader()
+        if not await self._world_exists(read_db, world_id):
+            raise LookupError("World not found")
 
+        async with self._db.write_transaction() as db:
             await db.execute(
                 """INSERT INTO guardian_runs
                    (id, world_id, trigger_kind, status, request_json, summary_json, error, started_at, completed_at, created_at, updated_at)
                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    run_id,
-                    world_id,
-                    data.trigger_kind,
-                    "running",
-                    request_json,
-                    None,
-                    None,
-                    now,
-                    None,
-                    now,
-                    now,
-                ),
+                run_row,
             )
-            await db.commit()
-        finally:
-            await db.close()
 
         status = "running"
         summary: dict[str, Any] | None = None
         error: str | None = None
+        finalized = False
 
-        db = await self._get_db()
         try:
-            notes = await self._list_notes(db, world_id)
-            note_ids = {str(note["id"]) for note in notes if note.get("id")}
-            entities = await self._list_entities(db, world_id)
-            relations = await self._list_relations(db, world_id)
-            markers = await self._list_markers(db, world_id)
-            operations = await self._list_operations(db, world_id)
+            note_ids, entities, relations, markers, operations = await self._load_world_canon(read_db, world_id)
             logger.info(
                 "[TEMP][CANON][scan] context_loaded run_id=%s entities=%d relations=%d markers=%d operations=%d",
                 run_id,
@@ -1465,7 +1654,9 @@ class CanonGuardianService:
                 len(operations),
             )
 
-            findings, actions, summary = self._run_hard_rules(
+            # The hard rules are pure CPU work; keep them off the event loop.
+            findings, actions, summary = await asyncio.to_thread(
+                self._run_hard_rules,
                 run_id=run_id,
                 world_id=world_id,
                 note_title=None,
@@ -1489,7 +1680,7 @@ class CanonGuardianService:
                     run_id,
                 )
                 soft_findings, soft_actions, llm_meta = await self._run_soft_critic(
-                    db=db,
+                    db=read_db,
                     run_id=run_id,
                     world_id=world_id,
                     note_ids=note_ids,
@@ -1522,13 +1713,9 @@ class CanonGuardianService:
                 )
 
             findings, actions = self._truncate_to_limit(findings, actions, data.max_findings)
-            await self._store_findings_and_actions(db, world_id, run_id, findings, actions)
+            severity_counts = Counter(finding.severity for finding in findings)
 
-            severity_counts: dict[str, int] = defaultdict(int)
-            for finding in findings:
-                severity_counts[finding.severity] += 1
-
-            summary = {
+            completed_summary = {
                 **(summary or {}),
                 "findings_total": len(findings),
                 "actions_total": len(actions),
@@ -1536,7 +1723,12 @@ class CanonGuardianService:
                 "hard_rules_completed_at": _now(),
                 "soft_critic": llm_meta,
             }
+            # Findings, actions and the completed run row land in one commit,
+            # so nothing is visible for the run while it is still running.
+            await self._persist_run(world_id, run_id, findings, actions, summary=completed_summary)
             status = "completed"
+            summary = completed_summary
+            finalized = True
             logger.info(
                 "[TEMP][CANON][scan] completed run_id=%s findings=%d actions=%d",
                 run_id,
@@ -1549,23 +1741,9 @@ class CanonGuardianService:
             error = str(exc)
             summary = summary or {"findings_total": 0, "actions_total": 0}
 
-        completed_at = _now()
-        await db.execute(
-            """UPDATE guardian_runs
-               SET status = ?, summary_json = ?, error = ?, completed_at = ?, updated_at = ?
-               WHERE world_id = ? AND id = ?""",
-            (
-                status,
-                json.dumps(summary or {}),
-                error,
-                completed_at,
-                completed_at,
-                world_id,
-                run_id,
-            ),
-        )
-        await db.commit()
-        await db.close()
+        if not finalized:
+            async with self._db.write_transaction() as db:
+                await self._finalize_run(db, world_id, run_id, status=status, summary=summary, error=error)
         logger.info(
             "[TEMP][CANON][scan] finalized run_id=%s status=%s error=%s",
             run_id,
@@ -1586,45 +1764,38 @@ class CanonGuardianService:
         run_id: str,
         include_details: bool = True,
     ) -> GuardianRunDetail | None:
-        db = await self._get_db()
-        try:
-            cursor = await db.execute(
-                "SELECT * FROM guardian_runs WHERE world_id = ? AND id = ?",
-                (world_id, run_id),
-            )
-            run_row = await cursor.fetchone()
-            if not run_row:
-                return None
-            run = _row_to_run(dict(run_row))
+        db = await self._db.reader()
+        cursor = await db.execute(
+            "SELECT * FROM guardian_runs WHERE world_id = ? AND id = ?",
+            (world_id, run_id),
+        )
+        run_row = await cursor.fetchone()
+        if not run_row:
+            return None
+        run_fields = _run_fields(run_row)
 
-            if not include_details:
-                return GuardianRunDetail(**run.model_dump())
+        if not include_details:
+            return GuardianRunDetail.model_construct(**run_fields, findings=[], actions=[])
 
-            finding_cursor = await db.execute(
-                """SELECT * FROM guardian_findings
-                   WHERE world_id = ? AND run_id = ?
-                   ORDER BY created_at ASC, id ASC""",
-                (world_id, run_id),
-            )
-            finding_rows = await finding_cursor.fetchall()
-            findings = [_row_to_finding(dict(row)) for row in finding_rows]
-
-            action_cursor = await db.execute(
-                """SELECT * FROM guardian_actions
-                   WHERE world_id = ? AND run_id = ?
-                   ORDER BY created_at ASC, id ASC""",
-                (world_id, run_id),
-            )
-            action_rows = await action_cursor.fetchall()
-            actions = [_row_to_action(dict(row)) for row in action_rows]
-        finally:
-            await db.close()
-
-        return GuardianRunDetail(
-            **run.model_dump(),
-            findings=findings,
-            actions=actions,
+        finding_cursor = await db.execute(
+            """SELECT * FROM guardian_findings
+               WHERE world_id = ? AND run_id = ?
+               ORDER BY created_at ASC, rowid ASC""",
+            (world_id, run_id),
+        )
+        finding_rows = await finding_cursor.fetchall()
+        findings = [_row_to_finding(row) for row in finding_rows]
+
+        action_cursor = await db.execute(
+            """SELECT * FROM guardian_actions
+               WHERE world_id = ? AND run_id = ?
+               ORDER BY created_at ASC, rowid ASC""",
+            (world_id, run_id),
         )
+        action_rows = await action_cursor.fetchall()
+        actions = [_row_to_action(row) for row in action_rows]
+
+        return GuardianRunDetail.model_construct(**run_fields, findings=findings, actions=actions)
 
     async def dismiss_finding(
         self,
@@ -1632,31 +1803,24 @@ class CanonGuardianService:
         run_id: str,
         finding_id: str,
     ) -> GuardianFindingStatusUpdate:
-        db = await self._get_db()
-        try:
-            run_cursor = await db.execute(
-                "SELECT 1 FROM guardian_runs WHERE world_id = ? AND id = ?",
-                (world_id, run_id),
-            )
-            run_row = await run_cursor.fetchone()
-            if not run_row:
-                raise LookupError("Guardian run not found")
-
+        now = _now()
+        async with self._db.write_transaction() as db:
+            # Check and mutate in one statement; only a miss pays for the run lookup.
             finding_cursor = await db.execute(
-                "SELECT resolution_status FROM guardian_findings WHERE world_id = ? AND run_id = ? AND id = ?",
-                (world_id, run_id, finding_id),
-            )
-            finding_row = await finding_cursor.fetchone()
-            if not finding_row:
-                raise LookupError("Guardian finding not found")
-
-            now = _now()
-            await db.execute(
                 """UPDATE guardian_findings
                    SET resolution_status = 'dismissed', updated_at = ?
-                   WHERE world_id = ? AND run_id = ? AND id = ?""",
+                   WHERE world_id = ? AND run_id = ? AND id = ?
+                   RETURNING id""",
                 (now, world_id, run_id, finding_id),
             )
+            if not await finding_cursor.fetchall():
+                run_cursor = await db.execute(
+                    "SELECT 1 FROM guardian_runs WHERE world_id = ? AND id = ?",
+                    (world_id, run_id),
+                )
+                if not await run_cursor.fetchone():
+                    raise LookupError("Guardian run not found")
+                raise LookupError("Guardian finding not found")
             await db.execute(
                 """UPDATE guardian_actions
                    SET status = 'rejected', updated_at = ?
@@ -1670,9 +1834,6 @@ class CanonGuardianService:
                    WHERE world_id = ? AND id = ?""",
                 (now, world_id, run_id),
             )
-            await db.commit()
-        finally:
-            await db.close()
 
         logger.info(
             "[TEMP][CANON][scan] finding_dismissed run_id=%s finding_id=%s world_id=%s",
@@ -1694,66 +1855,62 @@ class CanonGuardianService:
         run_id: str,
         data: GuardianApplyRequest,
     ) -> GuardianApplyResult:
-        db = await self._get_db()
-        try:
-            cursor = await db.execute(
-                "SELECT * FROM guardian_runs WHERE world_id = ? AND id = ?",
-                (world_id, run_id),
-            )
-            run_row = await cursor.fetchone()
-            if not run_row:
-                raise LookupError("Guardian run not found")
-
-            candidate_cursor = await db.execute(
-                """SELECT * FROM guardian_actions
-                   WHERE world_id = ? AND run_id = ? AND status IN ('proposed', 'accepted')""",
-                (world_id, run_id),
+        db = await self._db.reader()
+        cursor = await db.execute(
+            "SELECT 1 FROM guardian_runs WHERE world_id = ? AND id = ?",
+            (world_id, run_id),
+        )
+        if not await cursor.fetchone():
+            raise LookupError("Guardian run not found")
+
+        # Select candidates by predicate rather than loading them: apply_all
+        # needs no id list at all, and explicit ids travel as one JSON array
+        # so the statement text stays the same whatever the list length.
+        where = "world_id = ? AND run_id = ? AND status IN ('proposed', 'accepted')"
+        params: list[Any] = [world_id, run_id]
+        requested_ids: list[str] = []
+        if not data.apply_all:
+            requested_ids = list(set(data.action_ids))
+            where += " AND id IN (SELECT value FROM json_each(?))"
+            params.append(_dump_json(requested_ids))
+
+        if data.dry_run:
+            selected_count = 0
+            if data.apply_all or requested_ids:
+                count_cursor = await db.execute(f"SELECT COUNT(*) FROM guardian_actions WHERE {where}", params)
+                selected_count = (await count_cursor.fetchone())[0]
+            return GuardianApplyResult(
+                status="dry_run",
+                run_id=run_id,
+                world_id=world_id,
+                requested_actions=selected_count,
+                accepted_actions=selected_count,
+                applied_actions=0,
+                failed_actions=0,
+                message="Dry run only. Apply engine is not implemented yet.",
             )
-            candidate_rows = await candidate_cursor.fetchall()
-            candidate_actions = [_row_to_action(dict(row)) for row in candidate_rows]
-
-            if data.apply_all:
-                selected = candidate_actions
-            else:
-                requested_ids = set(data.action_ids)
-                selected = [action for action in candidate_actions if action.id in requested_ids]
-
-            if data.dry_run:
-                return GuardianApplyResult(
-                    status="dry_run",
-                    run_id=run_id,
-                    world_id=world_id,
-                    requested_actions=len(selected),
-                    accepted_actions=len(selected),
-                    applied_actions=0,
-                    failed_actions=0,
-                    message="Dry run only. Apply engine is not implemented yet.",
-                )
 
-            selected_ids = [action.id for action in selected]
+        selected_count = 0
+        if data.apply_all or requested_ids:
             now = _now()
-            if selected_ids:
-                placeholders = ", ".join("?" for _ in selected_ids)
-                await db.execute(
-                    f"""UPDATE guardian_actions
-                        SET status = 'accepted', updated_at = ?
-                        WHERE world_id = ? AND run_id = ? AND id IN ({placeholders})""",
-                    [now, world_id, run_id, *selected_ids],
-                )
-                await db.execute(
-                    "UPDATE guardian_runs SET status = 'partial', updated_at = ? WHERE world_id = ? AND id = ?",
-                    (now, world_id, run_id),
+            async with self._db.write_transaction() as db:
+                update_cursor = await db.execute(
+                    f"UPDATE guardian_actions SET status = 'accepted', updated_at = ? WHERE {where} RETURNING id",
+                    [now, *params],
                 )
-                await db.commit()
-        finally:
-            await db.close()
+                selected_count = len(await update_cursor.fetchall())
+                if selected_count:
+                    await db.execute(
+                        "UPDATE guardian_runs SET status = 'partial', updated_at = ? WHERE world_id = ? AND id = ?",
+                        (now, world_id, run_id),
+                    )
 
         return GuardianApplyResult(
             status="accepted_not_applied",
             run_id=run_id,
             world_id=world_id,
-            requested_actions=len(selected),
-            accepted_actions=len(selected),
+            requested_actions=selected_count,
+            accepted_actions=selected_count,
             applied_actions=0,
             failed_actions=0,
             message="Actions were accepted, but execution is not implemented yet.",
@@ -1,12 +1,17 @@
 """Canon Guardian Mechanic service for generating and accepting remediation options."""
 
+import asyncio
 import json
+import math
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
 import aiosqlite
+import orjson
 
+from app.database.db import SharedConnection
 from app.logging import get_logger
 from app.models import (
     MechanicAcceptRequest,
@@ -17,7 +22,6 @@ from app.models import (
     MechanicRun,
     MechanicRunDetail,
     GuardianAction,
-    GuardianFinding,
     normalize_type,
 )
 from app.services.backboard import BackboardService
@@ -43,72 +47,199 @@ def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _parse_json(raw: str) -> Any:
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # stdlib json also accepts NaN/Infinity and arbitrarily large ints
+        return json.loads(raw)
+
+
 def _load_json(raw: str | None, fallback):
     if not raw:
         return fallback
     try:
-        return json.loads(raw)
+        return _parse_json(raw)
     except json.JSONDecodeError:
         return fallback
 
 
-def _row_to_finding(row: dict) -> GuardianFinding:
-    evidence_rows = _load_json(row.get("evidence_json"), [])
-    return GuardianFinding(
-        id=row["id"],
-        run_id=row["run_id"],
-        world_id=row["world_id"],
-        severity=row["severity"],
-        finding_code=row["finding_code"],
-        title=row["title"],
-        detail=row["detail"],
-        confidence=row["confidence"],
-        resolution_status=row["resolution_status"],
-        evidence=evidence_rows,
-        suggested_action_count=row["suggested_action_count"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-    )
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
 
 
-def _row_to_mechanic_run(row: dict) -> MechanicRun:
-    return MechanicRun(
-        id=row["id"],
-        world_id=row["world_id"],
-        run_id=row["run_id"],
-        status=row["status"],
-        request=_load_json(row.get("request_json"), {}),
-        summary=_load_json(row.get("summary_json"), None),
-        error=row.get("error"),
-        started_at=row.get("started_at"),
-        completed_at=row.get("completed_at"),
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
-    )
+def _dump_json(value: Any) -> str:
+    try:
+        dumped = orjson.dumps(value)
+    except TypeError:
+        # orjson rejects e.g. integers wider than 64 bits
+        return json.dumps(value)
+    # orjson writes NaN/Infinity as null; keep stdlib's NaN so values
+    # _parse_json accepted round-trip unchanged.
+    if b"null" in dumped and _has_non_finite(value):
+        return json.dumps(value)
+    return dumped.decode()
+
+
+def _payload_signature(payload: dict[str, Any]) -> str | bytes:
+    """Key-order-independent fingerprint of an option payload, for duplicate checks."""
+    try:
+        signature = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return json.dumps(payload, sort_keys=True)
+    # Don't let NaN/Infinity collapse onto null and pass for a duplicate.
+    if b"null" in signature and _has_non_finite(payload):
+        return json.dumps(payload, sort_keys=True)
+    return signature
+
+
+@lru_cache(maxsize=256)
+def _patch_sql(table: str, columns: tuple[str, ...], where: str) -> str:
+    # Patch fields are collected in a fixed order, so each column subset
+    # maps to one statement text and the sqlite3 statement cache stays warm.
+    set_clause = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE {where}"
+
+
+# Patch field specs: (payload key, transform). A transform returns the
+# column value, or _SKIP to leave the column untouched.
+_SKIP = object()
+
+
+def _patch_text(value: Any) -> Any:
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return _SKIP
+
+
+def _patch_nullable_text(value: Any) -> Any:
+    return value if value is None or isinstance(value, str) else _SKIP
+
+
+def _patch_type(value: Any) -> Any:
+    if value is None:
+        return _SKIP
+    return normalize_type(str(value or "")) or _SKIP
+
+
+def _patch_subtype(value: Any) -> Any:
+    if value is None or str(value).strip() == "":
+        return None
+    return normalize_type(str(value))
 
 
-def _row_to_mechanic_option(row: dict) -> MechanicOption:
-    return MechanicOption(
+def _patch_string_list(value: Any) -> Any:
+    if not isinstance(value, list):
+        return _SKIP
+    return _dump_json([str(item).strip() for item in value if str(item).strip()])
+
+
+def _patch_type_list(value: Any) -> Any:
+    if not isinstance(value, list):
+        return _SKIP
+    return _dump_json([normalize_type(str(item)) for item in value if str(item).strip()])
+
+
+def _patch_weight(value: Any) -> Any:
+    if value is None:
+        return _SKIP
+    try:
+        return max(0.0, min(1.0, float(value)))
+    except Exception as exc:
+        raise ValueError("relation_patch weight must be numeric") from exc
+
+
+_ENTITY_PATCH_FIELDS = (
+    ("name", _patch_text),
+    ("type", _patch_type),
+    ("subtype", _patch_subtype),
+    ("aliases", _patch_string_list),
+    ("context", _patch_nullable_text),
+    ("summary", _patch_nullable_text),
+    ("tags", _patch_string_list),
+    ("image_url", _patch_nullable_text),
+    ("status", _patch_text),
+)
+_RELATION_PATCH_FIELDS = (
+    ("type", _patch_type),
+    ("context", _patch_nullable_text),
+    ("weight", _patch_weight),
+)
+_WORLD_PATCH_FIELDS = (
+    ("name", _patch_text),
+    ("description", _patch_nullable_text),
+    ("entity_types", _patch_type_list),
+    ("relation_types", _patch_type_list),
+)
+
+
+def _patch_fields(payload: dict[str, Any], spec) -> dict[str, Any]:
+    """Collect column values for the payload keys a spec knows, in spec order."""
+    fields: dict[str, Any] = {}
+    for key, transform in spec:
+        if key in payload:
+            value = transform(payload[key])
+            if value is not _SKIP:
+                fields[key] = value
+    return fields
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+# Mechanic rows are only ever written by this service, so they are loaded
+# with model_construct; timestamps are parsed here to keep datetime fields.
+
+
+def _mechanic_run_fields(row: aiosqlite.Row) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "world_id": row["world_id"],
+        "run_id": row["run_id"],
+        "status": row["status"],
+        "request": _load_json(row["request_json"], {}),
+        "summary": _load_json(row["summary_json"], None),
+        "error": row["error"],
+        "started_at": _parse_timestamp(row["started_at"]),
+        "completed_at": _parse_timestamp(row["completed_at"]),
+        "created_at": _parse_timestamp(row["created_at"]),
+        "updated_at": _parse_timestamp(row["updated_at"]),
+    }
+
+
+def _row_to_mechanic_run(row: aiosqlite.Row) -> MechanicRun:
+    return MechanicRun.model_construct(**_mechanic_run_fields(row))
+
+
+def _row_to_mechanic_option(row: aiosqlite.Row) -> MechanicOption:
+    return MechanicOption.model_construct(
         id=row["id"],
         mechanic_run_id=row["mechanic_run_id"],
         world_id=row["world_id"],
         run_id=row["run_id"],
-        finding_id=row.get("finding_id"),
+        finding_id=row["finding_id"],
         option_index=row["option_index"],
         action_type=row["action_type"],
-        op_type=row.get("op_type"),
-        target_kind=row.get("target_kind"),
-        target_id=row.get("target_id"),
-        payload=_load_json(row.get("payload"), {}),
-        rationale=row.get("rationale"),
-        expected_outcome=row.get("expected_outcome"),
+        op_type=row["op_type"],
+        target_kind=row["target_kind"],
+        target_id=row["target_id"],
+        payload=_load_json(row["payload"], {}),
+        rationale=row["rationale"],
+        expected_outcome=row["expected_outcome"],
         risk_level=row["risk_level"],
         confidence=row["confidence"],
         status=row["status"],
-        mapped_action_id=row.get("mapped_action_id"),
-        error=row.get("error"),
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+        mapped_action_id=row["mapped_action_id"],
+        error=row["error"],
+        created_at=_parse_timestamp(row["created_at"]),
+        updated_at=_parse_timestamp(row["updated_at"]),
     )
 
 
@@ -118,12 +249,11 @@ class CanonMechanicService:
     def __init__(self, db_path: str, backboard: BackboardService | None = None):
         self.db_path = db_path
         self.backboard = backboard
+        self._db = SharedConnection(db_path)
 
-    async def _get_db(self) -> aiosqlite.Connection:
-        db = await aiosqlite.connect(self.db_path)
-        db.row_factory = aiosqlite.Row
-        await db.execute("PRAGMA foreign_keys = ON")
-        return db
+    async def close(self) -> None:
+        """Close the shared connections (called on application shutdown)."""
+        await self._db.close()
 
     async def _get_world_assistant_id(self, db: aiosqlite.Connection, world_id: str) -> str | None:
         cursor = await db.execute("SELECT assistant_id FROM worlds WHERE id = ?", (world_id,))
@@ -133,14 +263,6 @@ class CanonMechanicService:
         assistant_id = row["assistant_id"]
         return str(assistant_id) if assistant_id else None
 
-    async def _get_guardian_run(self, db: aiosqlite.Connection, world_id: str, run_id: str) -> dict | None:
-        cursor = await db.execute(
-            "SELECT * FROM guardian_runs WHERE world_id = ? AND id = ?",
-            (world_id, run_id),
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
-
     async def _list_findings(
         self,
         db: aiosqlite.Connection,
@@ -148,8 +270,11 @@ class CanonMechanicService:
         run_id: str,
         finding_ids: list[str],
         include_open_findings: bool,
-    ) -> list[GuardianFinding]:
-        query = """SELECT * FROM guardian_findings WHERE world_id = ? AND run_id = ?"""
+    ) -> list[aiosqlite.Row]:
+        # Only what the prompt and option validation read; evidence JSON is
+        # decoded lazily, for the findings that fit the context budget.
+        query = """SELECT id, severity, finding_code, title, detail, evidence_json
+                   FROM guardian_findings WHERE world_id = ? AND run_id = ?"""
         params: list[Any] = [world_id, run_id]
         if finding_ids:
             placeholders = ", ".join("?" for _ in finding_ids)
@@ -157,10 +282,9 @@ class CanonMechanicService:
             params.extend(finding_ids)
         elif include_open_findings:
             query += " AND resolution_status = 'open'"
-        query += " ORDER BY created_at ASC, id ASC"
+        query += " ORDER BY created_at ASC, rowid ASC"
         cursor = await db.execute(query, params)
-        rows = await cursor.fetchall()
-        return [_row_to_finding(dict(row)) for row in rows]
+        return await cursor.fetchall()
 
     async def _id_registry(self, db: aiosqlite.Connection, world_id: str) -> dict[str, set[str]]:
         registry: dict[str, set[str]] = {
@@ -170,35 +294,40 @@ class CanonMechanicService:
             "timeline_marker": set(),
             "timeline_operation": set(),
         }
-        cursor = await db.execute("SELECT id FROM entities WHERE world_id = ?", (world_id,))
-        registry["entity"] = {row["id"] for row in await cursor.fetchall()}
-        cursor = await db.execute("SELECT id FROM relations WHERE world_id = ?", (world_id,))
-        registry["relation"] = {row["id"] for row in await cursor.fetchall()}
-        cursor = await db.execute("SELECT id FROM timeline_markers WHERE world_id = ?", (world_id,))
-        registry["timeline_marker"] = {row["id"] for row in await cursor.fetchall()}
-        cursor = await db.execute("SELECT id FROM timeline_operations WHERE world_id = ?", (world_id,))
-        registry["timeline_operation"] = {row["id"] for row in await cursor.fetchall()}
+        cursor = await db.execute(
+            """SELECT 'entity', id FROM entities WHERE world_id = ?
+               UNION ALL SELECT 'relation', id FROM relations WHERE world_id = ?
+               UNION ALL SELECT 'timeline_marker', id FROM timeline_markers WHERE world_id = ?
+               UNION ALL SELECT 'timeline_operation', id FROM timeline_operations WHERE world_id = ?""",
+            (world_id, world_id, world_id, world_id),
+        )
+        for kind, item_id in await cursor.fetchall():
+            registry[kind].add(item_id)
         return registry
 
     def _build_findings_context(
         self,
-        findings: list[GuardianFinding],
+        findings: list[aiosqlite.Row],
         max_context_tokens: int,
     ) -> str:
         max_chars = max(800, max_context_tokens * 4)
         lines = ["[open_findings]"]
+        size = len(lines[0])
         for finding in findings:
-            evidence = ", ".join(f"{ev.kind}:{ev.id}" for ev in finding.evidence[:6]) or "none"
-            lines.append(
-                f"- finding_id={finding.id} | severity={finding.severity} | code={finding.finding_code}\n"
-                f"  title={finding.title}\n"
-                f"  detail={finding.detail}\n"
+            evidence_rows = _load_json(finding["evidence_json"], [])
+            evidence = ", ".join(f"{ev['kind']}:{ev['id']}" for ev in evidence_rows[:6]) or "none"
+            line = (
+                f"- finding_id={finding['id']} | severity={finding['severity']} | code={finding['finding_code']}\n"
+                f"  title={finding['title']}\n"
+                f"  detail={finding['detail']}\n"
                 f"  evidence={evidence}"
             )
-        text = "\n".join(lines)
-        if len(text) > max_chars:
-            return text[:max_chars] + "\n...<truncated>"
-        return text
+            lines.append(line)
+            size += 1 + len(line)
+            # Past the budget nothing later can make it into the prompt.
+            if size > max_chars:
+                return "\n".join(lines)[:max_chars] + "\n...<truncated>"
+        return "\n".join(lines)
 
     def _parse_mechanic_response(
         self,
@@ -207,7 +336,16 @@ class CanonMechanicService:
         world_id: str,
         run_id: str,
         raw_response: str,
-    ) -> list[MechanicOption]:
+        finding_ids: set[str],
+        id_registry: dict[str, set[str]],
+        confidence_threshold: float,
+        max_options: int,
+    ) -> tuple[list[MechanicOption], int, dict[str, int]]:
+        """Parse the LLM reply and keep the options that pass validation.
+
+        Rejected candidates are only counted, never turned into models.
+        Returns the accepted options, the raw option count and the rejection counts.
+        """
         text = (raw_response or "").strip()
         if text.startswith("```json"):
             text = text[7:]
@@ -215,99 +353,87 @@ class CanonMechanicService:
             text = text[3:]
         if text.endswith("```"):
             text = text[:-3]
-        data = json.loads(text.strip())
+        data = _parse_json(text.strip())
+        rejected = {
+            "invalid_finding": 0,
+            "low_confidence": 0,
+            "invalid_target_kind": 0,
+            "invalid_target_id": 0,
+            "duplicate": 0,
+        }
         raw_options = data.get("options", [])
         if not isinstance(raw_options, list):
-            return []
+            return [], 0, rejected
+        raw_count = sum(1 for item in raw_options if isinstance(item, dict))
 
-        options: list[MechanicOption] = []
+        accepted: list[MechanicOption] = []
+        seen_signatures: set[tuple[str, str, str, str | bytes]] = set()
+        created_at = datetime.now(timezone.utc)
         for index, item in enumerate(raw_options):
             if not isinstance(item, dict):
                 continue
-            action_type = normalize_type(str(item.get("action_type") or "noop"))
-            if action_type not in ALLOWED_ACTION_TYPES:
-                action_type = "noop"
-            target_kind = item.get("target_kind")
-            if target_kind is not None:
-                target_kind = normalize_type(str(target_kind))
-            risk_level = normalize_type(str(item.get("risk_level") or "medium"))
-            if risk_level not in ALLOWED_RISK_LEVELS:
-                risk_level = "medium"
+            finding_id = str(item.get("finding_id") or "") or None
+            if finding_id not in finding_ids:
+                rejected["invalid_finding"] += 1
+                continue
             try:
                 confidence = float(item.get("confidence", 0.0))
             except Exception:
                 confidence = 0.0
             confidence = max(0.0, min(1.0, confidence))
-            option = MechanicOption(
-                id=str(uuid4()),
-                mechanic_run_id=mechanic_run_id,
-                world_id=world_id,
-                run_id=run_id,
-                finding_id=str(item.get("finding_id") or "") or None,
-                option_index=index,
-                action_type=action_type,  # type: ignore[arg-type]
-                op_type=normalize_type(str(item.get("op_type") or "")) or None,
-                target_kind=target_kind,
-                target_id=str(item.get("target_id") or "") or None,
-                payload=item.get("payload") if isinstance(item.get("payload"), dict) else {},
-                rationale=str(item.get("rationale") or "").strip() or None,
-                expected_outcome=str(item.get("expected_outcome") or "").strip() or None,
-                risk_level=risk_level,  # type: ignore[arg-type]
-                confidence=confidence,
-                status="proposed",
-            )
-            options.append(option)
-        return options
-
-    def _validate_options(
-        self,
-        *,
-        options: list[MechanicOption],
-        findings: list[GuardianFinding],
-        id_registry: dict[str, set[str]],
-        confidence_threshold: float,
-        max_options: int,
-    ) -> tuple[list[MechanicOption], dict[str, int]]:
-        finding_ids = {finding.id for finding in findings}
-        accepted: list[MechanicOption] = []
-        rejected = {
-            "invalid_finding": 0,
-            "low_confidence": 0,
-            "invalid_target_kind": 0,
-            "invalid_target_id": 0,
-            "duplicate": 0,
-        }
-        seen_signatures: set[tuple[str, str, str, str]] = set()
-        for option in options:
-            if option.finding_id not in finding_ids:
-                rejected["invalid_finding"] += 1
-                continue
-            if option.confidence < confidence_threshold:
+            if confidence < confidence_threshold:
                 rejected["low_confidence"] += 1
                 continue
-            target_kind = normalize_type(option.target_kind or "")
+            target_kind = item.get("target_kind")
+            if target_kind is not None:
+                target_kind = normalize_type(str(target_kind))
             if target_kind and target_kind not in ALLOWED_TARGET_KINDS:
                 rejected["invalid_target_kind"] += 1
                 continue
-            if target_kind and option.target_id:
-                valid_ids = id_registry.get(target_kind if target_kind != "world" else "world", set())
-                if option.target_id not in valid_ids:
-                    rejected["invalid_target_id"] += 1
-                    continue
-            signature = (
-                option.finding_id or "",
-                option.action_type,
-                option.target_kind or "",
-                json.dumps(option.payload, sort_keys=True),
-            )
+            target_id = str(item.get("target_id") or "") or None
+            if target_kind and target_id and target_id not in id_registry.get(target_kind, set()):
+                rejected["invalid_target_id"] += 1
+                continue
+            action_type = normalize_type(str(item.get("action_type") or "noop"))
+            if action_type not in ALLOWED_ACTION_TYPES:
+                action_type = "noop"
+            payload = item.get("payload")
+            if not isinstance(payload, dict):
+                payload = {}
+            signature = (finding_id, action_type, target_kind or "", _payload_signature(payload))
             if signature in seen_signatures:
                 rejected["duplicate"] += 1
                 continue
             seen_signatures.add(signature)
-            accepted.append(option)
+
+            risk_level = normalize_type(str(item.get("risk_level") or "medium"))
+            if risk_level not in ALLOWED_RISK_LEVELS:
+                risk_level = "medium"
+            accepted.append(
+                MechanicOption(
+                    id=str(uuid4()),
+                    mechanic_run_id=mechanic_run_id,
+                    world_id=world_id,
+                    run_id=run_id,
+                    finding_id=finding_id,
+                    option_index=index,
+                    action_type=action_type,  # type: ignore[arg-type]
+                    op_type=normalize_type(str(item.get("op_type") or "")) or None,
+                    target_kind=target_kind,
+                    target_id=target_id,
+                    payload=payload,
+                    rationale=str(item.get("rationale") or "").strip() or None,
+                    expected_outcome=str(item.get("expected_outcome") or "").strip() or None,
+                    risk_level=risk_level,  # type: ignore[arg-type]
+                    confidence=confidence,
+                    status="proposed",
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
             if len(accepted) >= max_options:
                 break
-        return accepted, rejected
+        return accepted, raw_count, rejected
 
     async def _store_options(
         self,
@@ -315,38 +441,68 @@ class CanonMechanicService:
         mechanic_run_id: str,
         options: list[MechanicOption],
     ) -> None:
+        rows = [
+            (
+                option.id,
+                option.mechanic_run_id,
+                option.world_id,
+                option.run_id,
+                option.finding_id,
+                option.option_index,
+                option.action_type,
+                option.op_type,
+                option.target_kind,
+                option.target_id,
+                _dump_json(option.payload),
+                option.rationale,
+                option.expected_outcome,
+                option.risk_level,
+                float(option.confidence),
+                option.status,
+                option.mapped_action_id,
+                option.error,
+                str(option.created_at),
+                str(option.updated_at),
+            )
+            for option in options
+        ]
         await db.execute(
             "DELETE FROM guardian_mechanic_options WHERE mechanic_run_id = ?",
             (mechanic_run_id,),
         )
-        for option in options:
-            await db.execute(
-                """INSERT INTO guardian_mechanic_options
-                   (id, mechanic_run_id, world_id, run_id, finding_id, option_index, action_type, op_type, target_kind, target_id, payload, rationale, expected_outcome, risk_level, confidence, status, mapped_action_id, error, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    option.id,
-                    option.mechanic_run_id,
-                    option.world_id,
-                    option.run_id,
-                    option.finding_id,
-                    option.option_index,
-                    option.action_type,
-                    option.op_type,
-                    option.target_kind,
-                    option.target_id,
-                    json.dumps(option.payload),
-                    option.rationale,
-                    option.expected_outcome,
-                    option.risk_level,
-                    float(option.confidence),
-                    option.status,
-                    option.mapped_action_id,
-                    option.error,
-                    str(option.created_at),
-                    str(option.updated_at),
-                ),
-            )
+        await db.executemany(
+            """INSERT INTO guardian_mechanic_options
+               (id, mechanic_run_id, world_id, run_id, finding_id, option_index, action_type, op_type, target_kind, target_id, payload, rationale, expected_outcome, risk_level, confidence, status, mapped_action_id, error, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+
+    async def _finalize_run(
+        self,
+        db: aiosqlite.Connection,
+        world_id: str,
+        mechanic_run_id: str,
+        *,
+        status: str,
+        summary: dict[str, Any] | None,
+        error: str | None,
+    ) -> None:
+        """Write the run's terminal state; the caller owns the transaction."""
+        completed_at = _now()
+        await db.execute(
+            """UPDATE guardian_mechanic_runs
+               SET status = ?, summary_json = ?, error = ?, completed_at = ?, updated_at = ?
+               WHERE world_id = ? AND id = ?""",
+            (
+                status,
+                _dump_json(summary or {}),
+                error,
+                completed_at,
+                completed_at,
+                world_id,
+                mechanic_run_id,
+            ),
+        )
 
     async def create_mechanic_run(
         self,
@@ -356,7 +512,7 @@ class CanonMechanicService:
     ) -> MechanicGenerateAccepted:
         mechanic_run_id = str(uuid4())
         now = _now()
-        request_json = json.dumps(data.model_dump())
+        request_json = _dump_json(data.model_dump())
         logger.info(
             "[TEMP][CANON][mechanic] start mechanic_run_id=%s world_id=%s run_id=%s include_open=%s finding_ids=%d",
             mechanic_run_id,
@@ -366,16 +522,13 @@ class CanonMechanicService:
             len(data.finding_ids),
         )
 
-        db = await self._get_db()
-        try:
-            run_row = await self._get_guardian_run(db, world_id, run_id)
-            if not run_row:
-                raise LookupError("Guardian run not found")
-
-            await db.execute(
+        async with self._db.write_transaction() as db:
+            # The guardian run check rides on the INSERT: no row, no insert.
+            cursor = await db.execute(
                 """INSERT INTO guardian_mechanic_runs
                    (id, world_id, run_id, status, request_json, summary_json, error, started_at, completed_at, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                   SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+                   WHERE EXISTS (SELECT 1 FROM guardian_runs WHERE world_id = ? AND id = ?)""",
                 (
                     mechanic_run_id,
                     world_id,
@@ -388,17 +541,19 @@ class CanonMechanicService:
                     None,
                     now,
                     now,
+                    world_id,
+                    run_id,
                 ),
             )
-            await db.commit()
-        finally:
-            await db.close()
+            if cursor.rowcount <= 0:
+                raise LookupError("Guardian run not found")
 
         status = "running"
         summary: dict[str, Any] = {}
         error: str | None = None
+        finalized = False
 
-        db = await self._get_db()
+        db = await self._db.reader()
         try:
             findings = await self._list_findings(
                 db=db,
@@ -419,7 +574,7 @@ class CanonMechanicService:
                     "[TEMP][CANON][mechanic] skipped mechanic_run_id=%s reason=no_findings",
                     mechanic_run_id,
                 )
-            elif not self.backboard or not self.backboard.is_available:
+            elif not self.backboard or not self.backboard.available:
                 status = "failed"
                 error = "Backboard service is not available"
                 summary = {"finding_count": len(findings), "raw_options": 0, "accepted_options": 0}
@@ -450,9 +605,12 @@ class CanonMechanicService:
                         len(context),
                     )
                     thread_id: str | None = None
-                    raw_options: list[MechanicOption] = []
+                    raw_option_count = 0
                     accepted_options: list[MechanicOption] = []
                     rejected_meta: dict[str, int] = {}
+                    # The registry only depends on world_id: load it while the
+                    # LLM round-trip is in flight.
+                    registry_task = asyncio.create_task(self._id_registry(db, world_id))
                     try:
                         thread_result = await self.backboard.create_thread(assistant_id)
                         if not thread_result.success or not thread_result.id:
@@ -462,35 +620,46 @@ class CanonMechanicService:
                         if not chat_result.success or not chat_result.response:
                             raise ValueError("Mechanic LLM returned no response")
 
-                        raw_options = self._parse_mechanic_response(
+                        id_registry = await registry_task
+                        accepted_options, raw_option_count, rejected_meta = self._parse_mechanic_response(
                             mechanic_run_id=mechanic_run_id,
                             world_id=world_id,
                             run_id=run_id,
                             raw_response=chat_result.response,
-                        )
-                        id_registry = await self._id_registry(db, world_id)
-                        accepted_options, rejected_meta = self._validate_options(
-                            options=raw_options,
-                            findings=findings,
+                            finding_ids={finding["id"] for finding in findings},
                             id_registry=id_registry,
                             confidence_threshold=data.confidence_threshold,
                             max_options=data.max_options,
                         )
-                        await self._store_options(db, mechanic_run_id, accepted_options)
-                        status = "completed"
-                        summary = {
+                        completed_summary = {
                             "finding_count": len(findings),
-                            "raw_options": len(raw_options),
+                            "raw_options": raw_option_count,
                             "accepted_options": len(accepted_options),
                             "rejected_options": rejected_meta,
                         }
+                        # Options and the completed run row land in one commit.
+                        async with self._db.write_transaction() as db:
+                            await self._store_options(db, mechanic_run_id, accepted_options)
+                            await self._finalize_run(
+                                db,
+                                world_id,
+                                mechanic_run_id,
+                                status="completed",
+                                summary=completed_summary,
+                                error=None,
+                            )
+                        status = "completed"
+                        summary = completed_summary
+                        finalized = True
                         logger.info(
                             "[TEMP][CANON][mechanic] llm_complete mechanic_run_id=%s raw_options=%d accepted_options=%d",
                             mechanic_run_id,
-                            len(raw_options),
+                            raw_option_count,
                             len(accepted_options),
                         )
                     finally:
+                        # Settle the registry load even when the LLM call failed.
+                        await asyncio.gather(registry_task, return_exceptions=True)
                         if thread_id:
                             try:
                                 await self.backboard.delete_thread(thread_id)
@@ -503,23 +672,9 @@ class CanonMechanicService:
             if not summary:
                 summary = {"finding_count": 0, "raw_options": 0, "accepted_options": 0}
 
-        completed_at = _now()
-        await db.execute(
-            """UPDATE guardian_mechanic_runs
-               SET status = ?, summary_json = ?, error = ?, completed_at = ?, updated_at = ?
-               WHERE world_id = ? AND id = ?""",
-            (
-                status,
-                json.dumps(summary or {}),
-                error,
-                completed_at,
-                completed_at,
-                world_id,
-                mechanic_run_id,
-            ),
-        )
-        await db.commit()
-        await db.close()
+        if not finalized:
+            async with self._db.write_transaction() as db:
+                await self._finalize_run(db, world_id, mechanic_run_id, status=status, summary=summary, error=error)
         logger.info(
             "[TEMP][CANON][mechanic] finalized mechanic_run_id=%s status=%s error=%s",
             mechanic_run_id,
@@ -541,31 +696,28 @@ class CanonMechanicService:
         mechanic_run_id: str,
         include_options: bool = True,
     ) -> MechanicRunDetail | None:
-        db = await self._get_db()
-        try:
-            cursor = await db.execute(
-                "SELECT * FROM guardian_mechanic_runs WHERE world_id = ? AND id = ?",
+        db = await self._db.reader()
+        cursor = await db.execute(
+            "SELECT * FROM guardian_mechanic_runs WHERE world_id = ? AND id = ?",
+            (world_id, mechanic_run_id),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        run_fields = _mechanic_run_fields(row)
+
+        options: list[MechanicOption] = []
+        if include_options:
+            option_cursor = await db.execute(
+                """SELECT * FROM guardian_mechanic_options
+                   WHERE world_id = ? AND mechanic_run_id = ?
+                   ORDER BY option_index ASC, created_at ASC, id ASC""",
                 (world_id, mechanic_run_id),
             )
-            row = await cursor.fetchone()
-            if not row:
-                return None
-            run = _row_to_mechanic_run(dict(row))
-
-            options: list[MechanicOption] = []
-            if include_options:
-                option_cursor = await db.execute(
-                    """SELECT * FROM guardian_mechanic_options
-                       WHERE world_id = ? AND mechanic_run_id = ?
-                       ORDER BY option_index ASC, created_at ASC, id ASC""",
-                    (world_id, mechanic_run_id),
-                )
-                option_rows = await option_cursor.fetchall()
-                options = [_row_to_mechanic_option(dict(option_row)) for option_row in option_rows]
-        finally:
-            await db.close()
+            option_rows = await option_cursor.fetchall()
+            options = [_row_to_mechanic_option(option_row) for option_row in option_rows]
 
-        return MechanicRunDetail(**run.model_dump(), options=options)
+        return MechanicRunDetail.model_construct(**run_fields, options=options)
 
     async def _apply_entity_patch(
         self,
@@ -578,47 +730,12 @@ class CanonMechanicService:
         if not option.target_id:
             return False, "entity_patch requires target_id"
 
-        payload = dict(option.payload or {})
-        fields: dict[str, Any] = {}
-
-        if isinstance(payload.get("name"), str):
-            name = payload["name"].strip()
-            if name:
-                fields["name"] = name
-        if payload.get("type") is not None:
-            normalized_type = normalize_type(str(payload.get("type") or ""))
-            if normalized_type:
-                fields["type"] = normalized_type
-        if "subtype" in payload:
-            subtype_raw = payload.get("subtype")
-            if subtype_raw is None or str(subtype_raw).strip() == "":
-                fields["subtype"] = None
-            else:
-                fields["subtype"] = normalize_type(str(subtype_raw))
-        if isinstance(payload.get("aliases"), list):
-            aliases = [str(value).strip() for value in payload["aliases"] if str(value).strip()]
-            fields["aliases"] = json.dumps(aliases)
-        if "context" in payload and (payload.get("context") is None or isinstance(payload.get("context"), str)):
-            fields["context"] = payload.get("context")
-        if "summary" in payload and (payload.get("summary") is None or isinstance(payload.get("summary"), str)):
-            fields["summary"] = payload.get("summary")
-        if isinstance(payload.get("tags"), list):
-            tags = [str(value).strip() for value in payload["tags"] if str(value).strip()]
-            fields["tags"] = json.dumps(tags)
-        if "image_url" in payload and (payload.get("image_url") is None or isinstance(payload.get("image_url"), str)):
-            fields["image_url"] = payload.get("image_url")
-        if isinstance(payload.get("status"), str):
-            status = payload["status"].strip()
-            if status:
-                fields["status"] = status
-
+        fields = _patch_fields(option.payload or {}, _ENTITY_PATCH_FIELDS)
         fields["source"] = "ai"
         fields["updated_at"] = now
-        set_clause = ", ".join(f"{key} = ?" for key in fields)
-        values = list(fields.values()) + [option.target_id, world_id]
         cursor = await db.execute(
-            f"UPDATE entities SET {set_clause} WHERE id = ? AND world_id = ?",
-            values,
+            _patch_sql("entities", tuple(fields), "id = ? AND world_id = ?"),
+            [*fields.values(), option.target_id, world_id],
         )
         if cursor.rowcount <= 0:
             return False, f"Entity target {option.target_id} not found"
@@ -635,28 +752,15 @@ class CanonMechanicService:
         if not option.target_id:
             return False, "relation_patch requires target_id"
 
-        payload = dict(option.payload or {})
-        fields: dict[str, Any] = {}
-        if payload.get("type") is not None:
-            normalized_type = normalize_type(str(payload.get("type") or ""))
-            if normalized_type:
-                fields["type"] = normalized_type
-        if "context" in payload and (payload.get("context") is None or isinstance(payload.get("context"), str)):
-            fields["context"] = payload.get("context")
-        if payload.get("weight") is not None:
-            try:
-                weight = float(payload["weight"])
-                fields["weight"] = max(0.0, min(1.0, weight))
-            except Exception:
-                return False, "relation_patch weight must be numeric"
-
+        try:
+            fields = _patch_fields(option.payload or {}, _RELATION_PATCH_FIELDS)
+        except ValueError as exc:
+            return False, str(exc)
         fields["source"] = "ai"
         fields["updated_at"] = now
-        set_clause = ", ".join(f"{key} = ?" for key in fields)
-        values = list(fields.values()) + [option.target_id, world_id]
         cursor = await db.execute(
-            f"UPDATE relations SET {set_clause} WHERE id = ? AND world_id = ?",
-            values,
+            _patch_sql("relations", tuple(fields), "id = ? AND world_id = ?"),
+            [*fields.values(), option.target_id, world_id],
         )
         if cursor.rowcount <= 0:
             return False, f"Relation target {option.target_id} not found"
@@ -706,30 +810,14 @@ class CanonMechanicService:
         option: MechanicOption,
         now: str,
     ) -> tuple[bool, str | None]:
-        payload = dict(option.payload or {})
-        fields: dict[str, Any] = {}
-        if isinstance(payload.get("name"), str):
-            name = payload["name"].strip()
-            if name:
-                fields["name"] = name
-        if "description" in payload and (payload.get("description") is None or isinstance(payload.get("description"), str)):
-            fields["description"] = payload.get("description")
-        if isinstance(payload.get("entity_types"), list):
-            entity_types = [normalize_type(str(value)) for value in payload["entity_types"] if str(value).strip()]
-            fields["entity_types"] = json.dumps(entity_types)
-        if isinstance(payload.get("relation_types"), list):
-            relation_types = [normalize_type(str(value)) for value in payload["relation_types"] if str(value).strip()]
-            fields["relation_types"] = json.dumps(relation_types)
-
+        fields = _patch_fields(option.payload or {}, _WORLD_PATCH_FIELDS)
         if not fields:
             return True, None
 
         fields["updated_at"] = now
-        set_clause = ", ".join(f"{key} = ?" for key in fields)
-        values = list(fields.values()) + [world_id]
         cursor = await db.execute(
-            f"UPDATE worlds SET {set_clause} WHERE id = ?",
-            values,
+            _patch_sql("worlds", tuple(fields), "id = ?"),
+            [*fields.values(), world_id],
         )
         if cursor.rowcount <= 0:
             return False, f"World target {world_id} not found"
@@ -798,6 +886,7 @@ class CanonMechanicService:
         world_id: str,
         option: MechanicOption,
         now: str,
+        next_order_by_marker: dict[str, int],
     ) -> tuple[bool, str | None]:
         payload = dict(option.payload or {})
         marker_id = await self._resolve_marker_for_timeline_action(db, world_id=world_id, payload=payload)
@@ -827,12 +916,17 @@ class CanonMechanicService:
             if key not in {"marker_id", "op_type", "target_kind", "target_id"}
         }
 
-        cursor = await db.execute(
-            "SELECT COALESCE(MAX(order_index), -1) + 1 AS next_index FROM timeline_operations WHERE world_id = ? AND marker_id = ?",
-            (world_id, marker_id),
-        )
-        row = await cursor.fetchone()
-        next_index = int(row["next_index"]) if row else 0
+        # Read the marker's tail once per accept call; later ops on the same
+        # marker continue from the in-memory counter.
+        next_index = next_order_by_marker.get(marker_id)
+        if next_index is None:
+            cursor = await db.execute(
+                "SELECT COALESCE(MAX(order_index), -1) + 1 AS next_index FROM timeline_operations WHERE world_id = ? AND marker_id = ?",
+                (world_id, marker_id),
+            )
+            row = await cursor.fetchone()
+            next_index = int(row["next_index"]) if row else 0
+        next_order_by_marker[marker_id] = next_index + 1
 
         await db.execute(
             """INSERT INTO timeline_operations
@@ -845,7 +939,7 @@ class CanonMechanicService:
                 op_type,
                 target_kind,
                 target_id,
-                json.dumps(op_payload),
+                _dump_json(op_payload),
                 next_index,
                 now,
                 now,
@@ -860,6 +954,7 @@ class CanonMechanicService:
         world_id: str,
         option: MechanicOption,
         now: str,
+        next_order_by_marker: dict[str, int],
     ) -> tuple[bool, str | None]:
         action_type = normalize_type(option.action_type or "")
         if action_type == "noop":
@@ -875,7 +970,13 @@ class CanonMechanicService:
         if action_type == "world_patch":
             return await self._apply_world_patch(db, world_id=world_id, option=option, now=now)
         if action_type == "timeline_operation":
-            return await self._apply_timeline_operation(db, world_id=world_id, option=option, now=now)
+            return await self._apply_timeline_operation(
+                db,
+                world_id=world_id,
+                option=option,
+                now=now,
+                next_order_by_marker=next_order_by_marker,
+            )
         return False, f"Unsupported action_type: {action_type}"
 
     async def accept_options(
@@ -893,8 +994,8 @@ class CanonMechanicService:
             data.create_guardian_actions,
             data.apply_immediately,
         )
-        db = await self._get_db()
-        try:
+        # Selection, action inserts, apply outcomes and run status land in one commit.
+        async with self._db.write_transaction() as db:
             cursor = await db.execute(
                 "SELECT * FROM guardian_mechanic_runs WHERE world_id = ? AND id = ?",
                 (world_id, mechanic_run_id),
@@ -902,7 +1003,7 @@ class CanonMechanicService:
             run_row = await cursor.fetchone()
             if not run_row:
                 raise LookupError("Mechanic run not found")
-            run = _row_to_mechanic_run(dict(run_row))
+            run = _row_to_mechanic_run(run_row)
 
             option_cursor = await db.execute(
                 """SELECT * FROM guardian_mechanic_options
@@ -910,7 +1011,7 @@ class CanonMechanicService:
                 (world_id, mechanic_run_id),
             )
             option_rows = await option_cursor.fetchall()
-            candidate_options = [_row_to_mechanic_option(dict(row)) for row in option_rows]
+            candidate_options = [_row_to_mechanic_option(row) for row in option_rows]
 
             if data.accept_all:
                 selected = candidate_options
@@ -946,7 +1047,9 @@ class CanonMechanicService:
             action_id_by_option_id: dict[str, str] = {}
             selected_ids = [option.id for option in selected]
             proposed_selected_ids = [option.id for option in selected if option.status == "proposed"]
-            if proposed_selected_ids:
+            # With apply_immediately every selected option gets its terminal
+            # status below, so the intermediate 'accepted' write is skipped.
+            if proposed_selected_ids and not data.apply_immediately:
                 placeholders = ", ".join("?" for _ in proposed_selected_ids)
                 await db.execute(
                     f"""UPDATE guardian_mechanic_options
@@ -956,51 +1059,87 @@ class CanonMechanicService:
                 )
 
             if data.create_guardian_actions:
+                action_rows: list[tuple[Any, ...]] = []
+                mapping_rows: list[tuple[str, str, str, str]] = []
                 for option in selected:
                     if option_status_by_id.get(option.id) != "proposed":
                         continue
                     action_id = str(uuid4())
+                    action_rows.append(
+                        (
+                            action_id,
+                            option.run_id,
+                            option.finding_id,
+                            world_id,
+                            option.action_type,
+                            option.op_type,
+                            option.target_kind,
+                            option.target_id,
+                            _dump_json(option.payload),
+                            option.rationale,
+                            "accepted",
+                            None,
+                            now,
+                            now,
+                        )
+                    )
+                    mapping_rows.append((action_id, now, option.id, mechanic_run_id))
+                if action_rows:
+                    await db.execute("SAVEPOINT mechanic_accept_actions")
                     try:
-                        await db.execute(
+                        await db.executemany(
                             """INSERT INTO guardian_actions
                                (id, run_id, finding_id, world_id, action_type, op_type, target_kind, target_id, payload, rationale, status, error, created_at, updated_at)
                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                            (
-                                action_id,
-                                option.run_id,
-                                option.finding_id,
-                                world_id,
-                                option.action_type,
-                                option.op_type,
-                                option.target_kind,
-                                option.target_id,
-                                json.dumps(option.payload),
-                                option.rationale,
-                                "accepted",
-                                None,
-                                now,
-                                now,
-                            ),
+                            action_rows,
                         )
-                        action_id_by_option_id[option.id] = action_id
-                        await db.execute(
+                        await db.executemany(
                             """UPDATE guardian_mechanic_options
                                SET mapped_action_id = ?, updated_at = ?
                                WHERE id = ? AND mechanic_run_id = ?""",
-                            (action_id, now, option.id, mechanic_run_id),
+                            mapping_rows,
                         )
-                        actions_created += 1
                     except Exception:
-                        actions_failed += 1
-                        await db.execute(
-                            """UPDATE guardian_mechanic_options
-                               SET status = 'failed', error = ?, updated_at = ?
-                                WHERE id = ? AND mechanic_run_id = ?""",
-                            ("Failed to create guardian action.", now, option.id, mechanic_run_id),
-                        )
+                        # Drop the partial batch and retry row by row so only the
+                        # offending options are marked failed.
+                        await db.execute("ROLLBACK TO SAVEPOINT mechanic_accept_actions")
+                        await db.execute("RELEASE SAVEPOINT mechanic_accept_actions")
+                        for action_row, mapping_row in zip(action_rows, mapping_rows):
+                            option_id = mapping_row[2]
+                            try:
+                                await db.execute(
+                                    """INSERT INTO guardian_actions
+                                       (id, run_id, finding_id, world_id, action_type, op_type, target_kind, target_id, payload, rationale, status, error, created_at, updated_at)
+                                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                                    action_row,
+                                )
+                                action_id_by_option_id[option_id] = action_row[0]
+                                await db.execute(
+                                    """UPDATE guardian_mechanic_options
+                                       SET mapped_action_id = ?, updated_at = ?
+                                       WHERE id = ? AND mechanic_run_id = ?""",
+                                    mapping_row,
+                                )
+                                actions_created += 1
+                            except Exception:
+                                actions_failed += 1
+                                await db.execute(
+                                    """UPDATE guardian_mechanic_options
+                                       SET status = 'failed', error = ?, updated_at = ?
+                                        WHERE id = ? AND mechanic_run_id = ?""",
+                                    ("Failed to create guardian action.", now, option_id, mechanic_run_id),
+                                )
+                    else:
+                        await db.execute("RELEASE SAVEPOINT mechanic_accept_actions")
+                        for action_row, mapping_row in zip(action_rows, mapping_rows):
+                            action_id_by_option_id[mapping_row[2]] = action_row[0]
+                        actions_created = len(action_rows)
 
             if data.apply_immediately:
                 applied_finding_ids: set[str] = set()
+                next_order_by_marker: dict[str, int] = {}
+                option_status_rows: list[tuple[str, str | None, str, str, str, str]] = []
+                action_status_rows: list[tuple[str, str | None, str, str, str]] = []
                 for option in selected:
                     if option.status not in {"proposed", "accepted"}:
                         continue
@@ -1010,42 +1149,36 @@ class CanonMechanicService:
                         world_id=world_id,
                         option=option,
                         now=option_now,
+                        next_order_by_marker=next_order_by_marker,
                     )
                     if success:
                         applied_options += 1
-                        await db.execute(
-                            """UPDATE guardian_mechanic_options
-                               SET status = 'applied', error = NULL, updated_at = ?
-                               WHERE world_id = ? AND mechanic_run_id = ? AND id = ?""",
-                            (option_now, world_id, mechanic_run_id, option.id),
-                        )
+                        outcome, failure_reason = "applied", None
                         if option.finding_id:
                             applied_finding_ids.add(option.finding_id)
-                        mapped_action_id = option.mapped_action_id or action_id_by_option_id.get(option.id)
-                        if mapped_action_id:
-                            await db.execute(
-                                """UPDATE guardian_actions
-                                   SET status = 'applied', error = NULL, updated_at = ?
-                                   WHERE world_id = ? AND id = ?""",
-                                (option_now, world_id, mapped_action_id),
-                            )
                     else:
                         apply_failures += 1
-                        failure_reason = error_text or "Failed to apply mechanic option."
-                        await db.execute(
-                            """UPDATE guardian_mechanic_options
-                               SET status = 'failed', error = ?, updated_at = ?
-                               WHERE world_id = ? AND mechanic_run_id = ? AND id = ?""",
-                            (failure_reason, option_now, world_id, mechanic_run_id, option.id),
-                        )
-                        mapped_action_id = option.mapped_action_id or action_id_by_option_id.get(option.id)
-                        if mapped_action_id:
-                            await db.execute(
-                                """UPDATE guardian_actions
-                                   SET status = 'failed', error = ?, updated_at = ?
-                                   WHERE world_id = ? AND id = ?""",
-                                (failure_reason, option_now, world_id, mapped_action_id),
-                            )
+                        outcome, failure_reason = "failed", error_text or "Failed to apply mechanic option."
+                    option_status_rows.append(
+                        (outcome, failure_reason, option_now, world_id, mechanic_run_id, option.id)
+                    )
+                    mapped_action_id = option.mapped_action_id or action_id_by_option_id.get(option.id)
+                    if mapped_action_id:
+                        action_status_rows.append((outcome, failure_reason, option_now, world_id, mapped_action_id))
+                if option_status_rows:
+                    await db.executemany(
+                        """UPDATE guardian_mechanic_options
+                           SET status = ?, error = ?, updated_at = ?
+                           WHERE world_id = ? AND mechanic_run_id = ? AND id = ?""",
+                        option_status_rows,
+                    )
+                if action_status_rows:
+                    await db.executemany(
+                        """UPDATE guardian_actions
+                           SET status = ?, error = ?, updated_at = ?
+                           WHERE world_id = ? AND id = ?""",
+                        action_status_rows,
+                    )
                 if applied_finding_ids:
                     placeholders = ", ".join("?" for _ in applied_finding_ids)
                     await db.execute(
@@ -1070,9 +1203,6 @@ class CanonMechanicService:
                     WHERE world_id = ? AND id = ?""",
                 (run_status, now, world_id, mechanic_run_id),
             )
-            await db.commit()
-        finally:
-            await db.close()
         logger.info(
             "[TEMP][CANON][mechanic] accept_complete mechanic_run_id=%s selected=%d actions_created=%d actions_failed=%d applied_options=%d apply_failures=%d",
             mechanic_run_id,
@@ -174,7 +174,7 @@ class HistorianService:
         message: str,
         thread_id: str | None = None,
     ) -> HistorianMessageResponse:
-        if not self.backboard.is_available:
+        if not self.backboard.available:
             raise ValueError("Backboard service is not available")
 
         world = await self._get_world(world_id)
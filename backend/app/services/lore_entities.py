@@ -284,7 +284,7 @@ class LoreEntityService:
     ) -> str | None:
         if not existing_context and not incoming_context:
             return None
-        if not self.backboard.is_available:
+        if not self.backboard.available:
             return incoming_context or existing_context
         assistant_id = await self.get_world_assistant_id(world_id)
         if not assistant_id:
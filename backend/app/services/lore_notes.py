@@ -725,7 +725,7 @@ class LoreNoteService:
         note = await self.get_note(world_id, note_id)
         if not note:
             raise ValueError(f"Note {note_id} not found")
-        if not self.backboard.is_available:
+        if not self.backboard.available:
             raise ValueError("Backboard service is not available")
 
         assistant_id = await self.entity_service.get_world_assistant_id(world_id)
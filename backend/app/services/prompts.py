@@ -1,14 +1,21 @@
 """Prompt builders shared across services."""
 
+import string
+from functools import lru_cache
 
+
+_WORLD_ASSISTANT_PROMPT = string.Template(
+    "You are a worldbuilding assistant for the world '$world_name'. "
+    "$description "
+    "When analyzing notes, extract entities, relations, and timeline markers as structured JSON. "
+    "Be precise with names and types. Reuse existing entity names when possible. "
+    "For timeline changes, use only: entity_create/entity_patch/entity_delete, relation_create/relation_patch/relation_delete, world_patch."
+)
+
+
+@lru_cache(maxsize=256)
 def build_world_assistant_prompt(world_name: str, description: str = "") -> str:
-    return (
-        f"You are a worldbuilding assistant for the world '{world_name}'. "
-        f"{description} "
-        "When analyzing notes, extract entities, relations, and timeline markers as structured JSON. "
-        "Be precise with names and types. Reuse existing entity names when possible. "
-        "For timeline changes, use only: entity_create/entity_patch/entity_delete, relation_create/relation_patch/relation_delete, world_patch."
-    )
+    return _WORLD_ASSISTANT_PROMPT.substitute(world_name=world_name, description=description)
 
 
 def build_historian_turn_prompt(
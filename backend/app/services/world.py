@@ -69,7 +69,7 @@ class WorldService:
 
         # Create a Backboard assistant for this world
         assistant_id = None
-        if self.backboard.is_available:
+        if self.backboard.available:
             result = await self.backboard.create_world_assistant(
                 data.name, data.description or ""
             )
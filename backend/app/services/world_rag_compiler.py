@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -12,6 +14,7 @@ from uuid import uuid4
 
 import aiosqlite
 
+from app.config import settings
 from app.logging import get_logger
 from app.models import RagCompileRequest, RagCompileResult, RagDocumentSyncStatusResult
 from app.services.backboard import BackboardService
@@ -77,6 +80,9 @@ RAG_SLOT_ORDER: list[tuple[str, str]] = [
     ("rules_invariants", "Rules and Invariants"),
 ]
 
+# Slots read back from DOCUMENTS_PATH by other services (historian rule pack).
+LOCAL_MIRROR_SLOT_KEYS = {"rules_invariants"}
+
 RECOMMENDED_SPARE_SLOT_KEYS: list[tuple[str, str]] = [
     ("aliases_disambiguation", "Aliases and Disambiguation"),
     ("open_questions_retcons", "Open Questions and Retcons"),
@@ -298,6 +304,22 @@ class WorldRagCompilerService:
     def _slot_document_type(self, slot_key: str) -> str:
         return f"rag_{slot_key}"
 
+    def _write_local_mirror(self, assistant_id: str, slot_key: str, content: str) -> None:
+        docs_dir = settings.DOCUMENTS_PATH
+        os.makedirs(docs_dir, exist_ok=True)
+        local_path = os.path.join(docs_dir, f"{assistant_id}_{self._slot_document_type(slot_key)}.md")
+        with open(local_path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+
+    async def _mirror_slot_locally(self, assistant_id: str, slot_key: str, content: str) -> None:
+        """Refresh the DOCUMENTS_PATH copy of a mirrored slot, whatever the upload outcome."""
+        if slot_key not in LOCAL_MIRROR_SLOT_KEYS:
+            return
+        try:
+            await asyncio.to_thread(self._write_local_mirror, assistant_id, slot_key, content)
+        except OSError as error:
+            logger.warning("[RAG][compile] local mirror write failed slot=%s error=%s", slot_key, error)
+
     def _render_header(self, world_name: str, world_description: str, slot_title: str) -> list[str]:
         return [
             f"# {slot_title}",
@@ -749,8 +771,56 @@ class WorldRagCompilerService:
                 )
         return ordered_slots
 
+    async def _record_slot_sync(
+        self,
+        db: aiosqlite.Connection,
+        *,
+        world_id: str,
+        assistant_id: str,
+        slot: _SlotContent,
+        sync_status: str,
+        rendered_content: str,
+        content_hash: str,
+        content_size: int,
+        existing_doc_id: str,
+        resolved_document_id: str | None,
+        error_message: str | None,
+    ) -> RagDocumentSyncStatusResult:
+        if not resolved_document_id:
+            return RagDocumentSyncStatusResult(
+                slot_key=slot.key,
+                slot_title=slot.title,
+                sync_status="failed",
+                document_id=existing_doc_id or None,
+                content_hash=content_hash,
+                content_size=content_size,
+                record_count=slot.record_count,
+                error=error_message or "Unknown sync error",
+            )
+
+        await self._upsert_slot_record(
+            db,
+            world_id=world_id,
+            assistant_id=assistant_id,
+            slot_key=slot.key,
+            slot_title=slot.title,
+            document_id=resolved_document_id,
+            content_hash=content_hash,
+            content_size=content_size,
+            record_count=slot.record_count,
+        )
+        return RagDocumentSyncStatusResult(
+            slot_key=slot.key,
+            slot_title=slot.title,
+            sync_status=sync_status,  # type: ignore[arg-type]
+            document_id=resolved_document_id,
+            content_hash=content_hash,
+            content_size=content_size,
+            record_count=slot.record_count,
+        )
+
     async def compile_world_documents(self, world_id: str, data: RagCompileRequest) -> RagCompileResult:
-        if not self.backboard.is_available:
+        if not self.backboard.available:
             raise ValueError("Backboard service is not available")
 
         db = await self._get_db()
@@ -785,6 +855,7 @@ class WorldRagCompilerService:
             unchanged_count = 0
             skipped_count = 0
             failed_count = 0
+            pending_creates: list[tuple[_SlotContent, str, str, int]] = []
 
             for slot in slot_payloads:
                 rendered_content = slot.content
@@ -855,30 +926,22 @@ class WorldRagCompilerService:
                     )
                     continue
 
-                sync_status = "created"
+                if not existing_doc_id:
+                    pending_creates.append((slot, rendered_content, content_hash, content_size))
+                    continue
+
+                await self._mirror_slot_locally(assistant_id, slot.key, rendered_content)
                 resolved_document_id: str | None = None
                 error_message: str | None = None
                 try:
-                    if existing_doc_id:
-                        sync_status = "updated"
-                        update_result = await self.backboard.update_lore_document(
-                            assistant_id=assistant_id,
-                            document_id=existing_doc_id,
-                            document_type=self._slot_document_type(slot.key),
-                            content=rendered_content,
-                        )
-                        if update_result.success and update_result.id:
-                            resolved_document_id = update_result.id
-                        else:
-                            create_result = await self.backboard.create_lore_document(
-                                assistant_id=assistant_id,
-                                document_type=self._slot_document_type(slot.key),
-                                content=rendered_content,
-                            )
-                            if create_result.success and create_result.id:
-                                resolved_document_id = create_result.id
-                            else:
-                                error_message = "Backboard update/create failed"
+                    update_result = await self.backboard.update_lore_document(
+                        assistant_id=assistant_id,
+                        document_id=existing_doc_id,
+                        document_type=self._slot_document_type(slot.key),
+                        content=rendered_content,
+                    )
+                    if update_result.success and update_result.id:
+                        resolved_document_id = update_result.id
                     else:
                         create_result = await self.backboard.create_lore_document(
                             assistant_id=assistant_id,
@@ -888,53 +951,61 @@ class WorldRagCompilerService:
                         if create_result.success and create_result.id:
                             resolved_document_id = create_result.id
                         else:
-                            error_message = "Backboard create failed"
+                            error_message = "Backboard update/create failed"
                 except Exception as error:
                     error_message = str(error)
 
-                if not resolved_document_id:
-                    failed_count += 1
-                    slot_results.append(
-                        RagDocumentSyncStatusResult(
-                            slot_key=slot.key,
-                            slot_title=slot.title,
-                            sync_status="failed",
-                            document_id=existing_doc_id or None,
-                            content_hash=content_hash,
-                            content_size=content_size,
-                            record_count=slot.record_count,
-                            error=error_message or "Unknown sync error",
-                        )
-                    )
-                    continue
-
-                if sync_status == "created":
-                    created_count += 1
-                else:
-                    updated_count += 1
-
-                await self._upsert_slot_record(
+                slot_result = await self._record_slot_sync(
                     db,
                     world_id=world_id,
                     assistant_id=assistant_id,
-                    slot_key=slot.key,
-                    slot_title=slot.title,
-                    document_id=resolved_document_id,
+                    slot=slot,
+                    sync_status="updated",
+                    rendered_content=rendered_content,
                     content_hash=content_hash,
                     content_size=content_size,
-                    record_count=slot.record_count,
+                    existing_doc_id=existing_doc_id,
+                    resolved_document_id=resolved_document_id,
+                    error_message=error_message,
                 )
-                slot_results.append(
-                    RagDocumentSyncStatusResult(
-                        slot_key=slot.key,
-                        slot_title=slot.title,
-                        sync_status=sync_status,  # type: ignore[arg-type]
-                        document_id=resolved_document_id,
+                if slot_result.sync_status == "failed":
+                    failed_count += 1
+                else:
+                    updated_count += 1
+                slot_results.append(slot_result)
+
+            if pending_creates:
+                for slot, rendered_content, _, _ in pending_creates:
+                    await self._mirror_slot_locally(assistant_id, slot.key, rendered_content)
+                create_results = await self.backboard.bulk_upload_documents(
+                    assistant_id,
+                    [(self._slot_document_type(slot.key), content) for slot, content, _, _ in pending_creates],
+                )
+                for (slot, rendered_content, content_hash, content_size), create_result in zip(
+                    pending_creates, create_results
+                ):
+                    resolved_document_id = create_result.id if create_result.success and create_result.id else None
+                    slot_result = await self._record_slot_sync(
+                        db,
+                        world_id=world_id,
+                        assistant_id=assistant_id,
+                        slot=slot,
+                        sync_status="created",
+                        rendered_content=rendered_content,
                         content_hash=content_hash,
                         content_size=content_size,
-                        record_count=slot.record_count,
+                        existing_doc_id="",
+                        resolved_document_id=resolved_document_id,
+                        error_message=None if resolved_document_id else "Backboard create failed",
                     )
-                )
+                    if slot_result.sync_status == "failed":
+                        failed_count += 1
+                    else:
+                        created_count += 1
+                    slot_results.append(slot_result)
+
+                slot_order = {slot.key: index for index, slot in enumerate(slot_payloads)}
+                slot_results.sort(key=lambda result: slot_order[result.slot_key])
 
             total_slots = len(slot_payloads)
             processed_slots = created_count + updated_count + unchanged_count + skipped_count + failed_count
@@ -156,7 +156,7 @@ class WorldRagSyncService:
             and bool(row)
             and int(row.get("pending_change_count", 0)) >= threshold
             and self._cooldown_elapsed(row.get("last_compile_attempt_at"))
-            and self.compiler.backboard.is_available
+            and self.compiler.backboard.available
         )
         if should_schedule:
             await self._schedule_background_compile(world_id, reason="change_threshold")